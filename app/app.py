@@ -812,7 +812,7 @@ with left_col:
     """, unsafe_allow_html=True)
     
     # Season indicator
-    season_info = TemporalConfig.get_season_info(datetime.now().month)
+    season_info = TemporalConfig.get_season_info()
     season_color = "#166534" if season_info['name'] == "Rabi (Wheat)" else "#b45309"
     season_bg = "#f0fdf4" if season_info['name'] == "Rabi (Wheat)" else "#fef3c7"
     
@@ -1086,20 +1086,22 @@ with right_col:
                     
                     # Probability bars
                     st.markdown("##### 📊 Class Probabilities")
+                    prob_bars = []
                     for cls, prob in sorted(result['probabilities'].items(), key=lambda x: x[1], reverse=True):
                         bar_color = "#22c55e" if cls == result['predicted_class'] else "#e5e7eb"
                         text_color = "#166534" if cls == result['predicted_class'] else "#4b5563"
-                        st.markdown(f"""
+                        prob_bars.append(f"""
                         <div style="margin-bottom: 12px;">
                             <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
                                 <span style="color: {text_color}; font-size: 13px; font-weight: 500;">{cls}</span>
                                 <span style="color: {text_color}; font-weight: 600;">{prob:.1%}</span>
                             </div>
                             <div style="background: #f3f4f6; border-radius: 4px; height: 10px; overflow: hidden;">
-                                <div style="background: {bar_color}; width: {prob*100}%; height: 100%; border-radius: 4px;"></div>
+                                <div style="background: {bar_color}; width: {prob*100:.1f}%; height: 100%; border-radius: 4px;"></div>
                             </div>
                         </div>
-                        """, unsafe_allow_html=True)
+                        """)
+                    st.markdown("".join(prob_bars), unsafe_allow_html=True)
                     
                     # Season validation warning
                     if result.get('season_validation', {}).get('was_adjusted'):
@@ -1255,13 +1257,11 @@ with right_col:
                     
                     with col1:
                         st.markdown("##### 🔍 Diagnosis")
-                        for issue in diagnosis['issues']:
-                            st.markdown(f"• {issue}")
+                        st.markdown("\n\n".join(f"• {issue}" for issue in diagnosis['issues']))
                     
                     with col2:
                         st.markdown("##### 💡 Recommendations")
-                        for rec in diagnosis['recommendations']:
-                            st.markdown(f"• {rec}")
+                        st.markdown("\n\n".join(f"• {rec}" for rec in diagnosis['recommendations']))
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     
@@ -1269,27 +1269,36 @@ with right_col:
                     with st.expander("📊 Detailed Health Metrics", expanded=False):
                         col1, col2 = st.columns(2)
                         
+                        # One markdown element per column rather than one per line
                         with col1:
-                            st.markdown("**NDVI Statistics**")
-                            st.markdown(f"- Mean: {indices['ndvi']['mean']:.3f}")
-                            st.markdown(f"- Min: {indices['ndvi']['min']:.3f}")
-                            st.markdown(f"- Max: {indices['ndvi']['max']:.3f}")
-                            st.markdown(f"- Std Dev: {indices['ndvi']['std']:.3f}")
-                            
-                            st.markdown("**EVI Statistics**")
-                            st.markdown(f"- Mean: {indices['evi']['mean']:.3f}")
-                            st.markdown(f"- Range: [{indices['evi']['min']:.3f}, {indices['evi']['max']:.3f}]")
+                            st.markdown("\n".join([
+                                "**NDVI Statistics**",
+                                "",
+                                f"- Mean: {indices['ndvi']['mean']:.3f}",
+                                f"- Min: {indices['ndvi']['min']:.3f}",
+                                f"- Max: {indices['ndvi']['max']:.3f}",
+                                f"- Std Dev: {indices['ndvi']['std']:.3f}",
+                                "",
+                                "**EVI Statistics**",
+                                "",
+                                f"- Mean: {indices['evi']['mean']:.3f}",
+                                f"- Range: [{indices['evi']['min']:.3f}, {indices['evi']['max']:.3f}]",
+                            ]))
                         
                         with col2:
-                            st.markdown("**Expected Range**")
                             expected = health_result['thresholds']['ndvi']
-                            st.markdown(f"- Min: {expected[0]:.2f}")
-                            st.markdown(f"- Max: {expected[1]:.2f}")
-                            st.markdown(f"- Healthy Threshold: {health_result['thresholds']['healthy_min']:.2f}")
-                            
-                            st.markdown("**Assessment Confidence**")
-                            st.markdown(f"- Level: {diagnosis['confidence'].upper()}")
-                            st.markdown(f"- Based on NDVI variability")
+                            st.markdown("\n".join([
+                                "**Expected Range**",
+                                "",
+                                f"- Min: {expected[0]:.2f}",
+                                f"- Max: {expected[1]:.2f}",
+                                f"- Healthy Threshold: {health_result['thresholds']['healthy_min']:.2f}",
+                                "",
+                                "**Assessment Confidence**",
+                                "",
+                                f"- Level: {diagnosis['confidence'].upper()}",
+                                "- Based on NDVI variability",
+                            ]))
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     
@@ -5,22 +5,25 @@
 
 import os
 import sys
+import math
+import time
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Optional
 from pathlib import Path
 
-# Add src to path for imports
+# Make src importable when helpers is used outside app.py, which
+# already puts it on sys.path; skip the insert if it is there
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+_SRC_DIR = str(PROJECT_ROOT / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import UIConfig, ModelConfig, GEEConfig
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +59,103 @@ def validate_coordinates(latitude: float, longitude: float) -> Tuple[bool, str]:
     return True, "✓ Valid coordinates within Punjab region"
 
 
+# Status codes returned by validate_coordinates_batch
+COORD_OK = 0
+COORD_OUTSIDE_PUNJAB = 1
+COORD_MISSING = 2
+COORD_INVALID_LAT = 3
+COORD_INVALID_LON = 4
+
+# Plain floats so the numba kernel can fold them in as constants
+_PUNJAB_MIN_LAT = float(GEEConfig.PUNJAB_BOUNDS['min_lat'])
+_PUNJAB_MAX_LAT = float(GEEConfig.PUNJAB_BOUNDS['max_lat'])
+_PUNJAB_MIN_LON = float(GEEConfig.PUNJAB_BOUNDS['min_lon'])
+_PUNJAB_MAX_LON = float(GEEConfig.PUNJAB_BOUNDS['max_lon'])
+
+
+def _validate_batch_numpy(lat, lon, status_out, valid_out):
+    """Vectorized fallback for the numba batch kernel."""
+    import numpy as np
+    
+    in_punjab = ((lat >= _PUNJAB_MIN_LAT) & (lat <= _PUNJAB_MAX_LAT) &
+                 (lon >= _PUNJAB_MIN_LON) & (lon <= _PUNJAB_MAX_LON))
+    
+    # Assign in reverse priority so earlier checks win, as in validate_coordinates
+    status_out[:] = np.where(in_punjab, COORD_OK, COORD_OUTSIDE_PUNJAB)
+    status_out[~((lon >= -180) & (lon <= 180))] = COORD_INVALID_LON
+    status_out[~((lat >= -90) & (lat <= 90))] = COORD_INVALID_LAT
+    status_out[np.isnan(lat) | np.isnan(lon)] = COORD_MISSING
+    valid_out[:] = status_out <= COORD_OUTSIDE_PUNJAB
+
+
+@lru_cache(maxsize=1)
+def _get_batch_kernel():
+    """
+    Return the batch validation kernel, built on first use.
+    
+    numba (and numpy with it) is only imported here so that importing
+    helpers stays cheap; without numba the numpy fallback is returned.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _validate_batch_numpy
+    
+    @njit(parallel=True, cache=True)
+    def _validate_batch_kernel(lat, lon, status_out, valid_out):
+        # Each iteration writes only index i, so prange is race-free
+        for i in prange(lat.shape[0]):
+            la = lat[i]
+            lo = lon[i]
+            if math.isnan(la) or math.isnan(lo):
+                status = COORD_MISSING
+            elif not (-90.0 <= la <= 90.0):
+                status = COORD_INVALID_LAT
+            elif not (-180.0 <= lo <= 180.0):
+                status = COORD_INVALID_LON
+            elif (_PUNJAB_MIN_LAT <= la <= _PUNJAB_MAX_LAT and
+                  _PUNJAB_MIN_LON <= lo <= _PUNJAB_MAX_LON):
+                status = COORD_OK
+            else:
+                status = COORD_OUTSIDE_PUNJAB
+            status_out[i] = status
+            valid_out[i] = status <= COORD_OUTSIDE_PUNJAB
+    
+    return _validate_batch_kernel
+
+
+def validate_coordinates_batch(latitudes, longitudes) -> Tuple:
+    """
+    Validate many coordinates at once.
+    
+    Same rules as validate_coordinates; NaN marks a missing value.
+    
+    Args:
+        latitudes: Array-like of latitude values
+        longitudes: Array-like of longitude values (same shape)
+        
+    Returns:
+        Tuple of (valid_mask, status_codes) arrays shaped like the input,
+        with status codes from the COORD_* constants
+    """
+    import numpy as np
+    
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+    if lat.shape != lon.shape:
+        raise ValueError("latitudes and longitudes must have the same shape")
+    
+    shape = lat.shape
+    lat = np.ascontiguousarray(lat).ravel()
+    lon = np.ascontiguousarray(lon).ravel()
+    status = np.empty(lat.shape, dtype=np.int8)
+    valid = np.empty(lat.shape, dtype=np.bool_)
+    
+    _get_batch_kernel()(lat, lon, status, valid)
+    
+    return valid.reshape(shape), status.reshape(shape)
+
+
 def format_coordinates(latitude: float, longitude: float, precision: int = 4) -> str:
     """
     Format coordinates for display.
@@ -68,16 +168,68 @@ def format_coordinates(latitude: float, longitude: float, precision: int = 4) ->
     Returns:
         Formatted string
     """
-    lat_dir = "N" if latitude >= 0 else "S"
-    lon_dir = "E" if longitude >= 0 else "W"
+    return _coordinate_format(precision).format(
+        abs(latitude), "N" if latitude >= 0 else "S",
+        abs(longitude), "E" if longitude >= 0 else "W",
+    )
+
+
+@lru_cache(maxsize=8)
+def _coordinate_format(precision: int) -> str:
+    """Format string for a given precision, built once per precision."""
+    return f"{{:.{precision}f}}° {{}}, {{:.{precision}f}}° {{}}"
+
+
+def format_coordinates_array(latitudes, longitudes, precision: int = 4):
+    """
+    Vectorized format_coordinates for many points.
+    
+    Args:
+        latitudes: Array-like of latitude values
+        longitudes: Array-like of longitude values (same shape)
+        precision: Decimal places
+        
+    Returns:
+        Array of formatted strings shaped like the input
+    """
+    import numpy as np
     
-    return f"{abs(latitude):.{precision}f}° {lat_dir}, {abs(longitude):.{precision}f}° {lon_dir}"
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+    number_format = f"%.{precision}f° "
+    
+    lat_text = np.char.add(np.char.mod(number_format, np.abs(lat)), np.where(lat >= 0, "N", "S"))
+    lon_text = np.char.add(np.char.mod(number_format, np.abs(lon)), np.where(lon >= 0, "E", "W"))
+    
+    return np.char.add(np.char.add(lat_text, ", "), lon_text)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CONFIDENCE & STATUS FORMATTING
 # ─────────────────────────────────────────────────────────────────────────────
 
+_CONFIDENCE_BADGES = MappingProxyType({
+    'high': ('🟢', 'High Confidence', '#2ecc71'),
+    'medium': ('🟡', 'Medium Confidence', '#f1c40f'),
+    'low': ('🔴', 'Low Confidence', '#e74c3c'),
+})
+_UNKNOWN_CONFIDENCE = ('⚪', 'Unknown', '#95a5a6')
+
+_HEALTH_BADGES = MappingProxyType({
+    'healthy': ('✅', 'Healthy', '#2ecc71'),
+    'moderate_stress': ('⚠️', 'Moderate Stress', '#f1c40f'),
+    'severe_stress': ('🔴', 'Severe Stress', '#e74c3c'),
+    'critical': ('❌', 'Critical', '#c0392b'),
+})
+_UNKNOWN_HEALTH = ('❓', 'Unknown', '#95a5a6')
+
+_CROP_ICONS = MappingProxyType({
+    'Rice': '🌾',
+    'Wheat': '🌿',
+    'Other': '🌱',
+})
+
+
 def get_confidence_badge(confidence_level: str) -> Tuple[str, str, str]:
     """
     Get badge elements for confidence level.
@@ -88,12 +240,7 @@ def get_confidence_badge(confidence_level: str) -> Tuple[str, str, str]:
     Returns:
         Tuple of (icon, label, color)
     """
-    badges = {
-        'high': ('🟢', 'High Confidence', '#2ecc71'),
-        'medium': ('🟡', 'Medium Confidence', '#f1c40f'),
-        'low': ('🔴', 'Low Confidence', '#e74c3c'),
-    }
-    return badges.get(confidence_level, ('⚪', 'Unknown', '#95a5a6'))
+    return _CONFIDENCE_BADGES.get(confidence_level, _UNKNOWN_CONFIDENCE)
 
 
 def get_health_badge(health_status: str) -> Tuple[str, str, str]:
@@ -106,23 +253,12 @@ def get_health_badge(health_status: str) -> Tuple[str, str, str]:
     Returns:
         Tuple of (icon, label, color)
     """
-    badges = {
-        'healthy': ('✅', 'Healthy', '#2ecc71'),
-        'moderate_stress': ('⚠️', 'Moderate Stress', '#f1c40f'),
-        'severe_stress': ('🔴', 'Severe Stress', '#e74c3c'),
-        'critical': ('❌', 'Critical', '#c0392b'),
-    }
-    return badges.get(health_status, ('❓', 'Unknown', '#95a5a6'))
+    return _HEALTH_BADGES.get(health_status, _UNKNOWN_HEALTH)
 
 
 def get_crop_icon(crop: str) -> str:
     """Get icon for crop type."""
-    icons = {
-        'Rice': '🌾',
-        'Wheat': '🌿',
-        'Other': '🌱',
-    }
-    return icons.get(crop, '🌱')
+    return _CROP_ICONS.get(crop, '🌱')
 
 
 def get_crop_color(crop: str) -> str:
@@ -134,96 +270,107 @@ def get_crop_color(crop: str) -> str:
 # DATA QUALITY INDICATORS
 # ─────────────────────────────────────────────────────────────────────────────
 
+# (min months, level, icon, label, description suffix, color), best first
+_QUALITY_LEVELS = (
+    (5, 'excellent', '🟢', 'Excellent Data Quality', 'Full seasonal coverage', '#2ecc71'),
+    (4, 'good', '🟢', 'Good Data Quality', 'Most seasonal data present', '#27ae60'),
+    (3, 'moderate', '🟡', 'Moderate Data Quality', 'Partial seasonal coverage', '#f1c40f'),
+    (2, 'limited', '🟠', 'Limited Data Quality', 'Limited accuracy', '#e67e22'),
+    (0, 'insufficient', '🔴', 'Insufficient Data', 'Results unreliable', '#e74c3c'),
+)
+
+
+def _make_quality(months_available: int) -> Mapping:
+    """Build the quality indicator entry for one month count."""
+    for min_months, level, icon, label, suffix, color in _QUALITY_LEVELS:
+        if months_available >= min_months:
+            break
+    return MappingProxyType({
+        'level': level,
+        'icon': icon,
+        'label': label,
+        'description': f'{months_available}/6 months available - {suffix}',
+        'color': color,
+        'percentage': (months_available / 6) * 100,
+    })
+
+
+# One precomputed entry per possible month count (0..6)
+_QUALITY_TABLE = tuple(_make_quality(m) for m in range(7))
+
+
 def get_data_quality_indicator(months_available: int) -> Dict:
     """
     Get data quality indicator based on available months.
     
     Args:
-        months_available: Number of months with satellite data
+        months_available: Number of months with satellite data (clamped to 0-6)
         
     Returns:
         Dictionary with quality information
     """
-    if months_available >= 5:
-        return {
-            'level': 'excellent',
-            'icon': '🟢',
-            'label': 'Excellent Data Quality',
-            'description': f'{months_available}/6 months available - Full seasonal coverage',
-            'color': '#2ecc71',
-            'percentage': (months_available / 6) * 100,
-        }
-    elif months_available >= 4:
-        return {
-            'level': 'good',
-            'icon': '🟢',
-            'label': 'Good Data Quality',
-            'description': f'{months_available}/6 months available - Most seasonal data present',
-            'color': '#27ae60',
-            'percentage': (months_available / 6) * 100,
-        }
-    elif months_available >= 3:
-        return {
-            'level': 'moderate',
-            'icon': '🟡',
-            'label': 'Moderate Data Quality',
-            'description': f'{months_available}/6 months available - Partial seasonal coverage',
-            'color': '#f1c40f',
-            'percentage': (months_available / 6) * 100,
-        }
-    elif months_available >= 2:
-        return {
-            'level': 'limited',
-            'icon': '🟠',
-            'label': 'Limited Data Quality',
-            'description': f'{months_available}/6 months available - Limited accuracy',
-            'color': '#e67e22',
-            'percentage': (months_available / 6) * 100,
-        }
-    else:
-        return {
-            'level': 'insufficient',
-            'icon': '🔴',
-            'label': 'Insufficient Data',
-            'description': f'{months_available}/6 months available - Results unreliable',
-            'color': '#e74c3c',
-            'percentage': (months_available / 6) * 100,
-        }
+    return dict(_QUALITY_TABLE[min(max(int(months_available), 0), 6)])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PROBABILITY FORMATTING
 # ─────────────────────────────────────────────────────────────────────────────
 
-def format_probabilities(probabilities: Dict[str, float]) -> list:
+def format_probabilities(probabilities: Dict[str, float], top_k: Optional[int] = None) -> list:
     """
     Format class probabilities for display.
     
     Args:
         probabilities: Dictionary of class -> probability
+        top_k: Only format the k most likely classes (None for all)
         
     Returns:
         List of formatted probability dictionaries, sorted by probability
     """
-    formatted = []
-    for class_name, prob in probabilities.items():
-        formatted.append({
-            'class': class_name,
-            'probability': prob,
-            'percentage': f"{prob * 100:.1f}%",
-            'icon': get_crop_icon(class_name),
-            'color': get_crop_color(class_name),
-        })
+    import numpy as np
     
-    # Sort by probability descending
-    formatted.sort(key=lambda x: x['probability'], reverse=True)
-    return formatted
+    names = list(probabilities)
+    probs = list(probabilities.values())
+    
+    # Sort by probability descending; stable so ties keep input order
+    order = np.argsort(-np.asarray(probs, dtype=np.float64), kind='stable')[:top_k]
+    
+    return [
+        {
+            'class': names[i],
+            'probability': probs[i],
+            'percentage': f"{probs[i] * 100:.1f}%",
+            'icon': _CROP_ICONS.get(names[i], '🌱'),
+            'color': get_crop_color(names[i]),
+        }
+        for i in order
+    ]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # NDVI FORMATTING
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Upper bounds of each NDVI band; bisect_right keeps the original
+# "ndvi < cut" semantics, so a value equal to a cut falls in the next band
+_NDVI_CUTS = (0.1, 0.2, 0.4, 0.6)
+
+_NDVI_META = (
+    ('Bare soil / Water', '#8b4513'),
+    ('Sparse vegetation', '#d4a574'),
+    ('Moderate vegetation', '#90EE90'),
+    ('Dense vegetation', '#228B22'),
+    ('Very healthy vegetation', '#006400'),
+)
+
+_NDVI_MISSING = {
+    'value': None,
+    'formatted': 'N/A',
+    'interpretation': 'No data available',
+    'color': '#95a5a6',
+}
+
+
 def format_ndvi(ndvi: float) -> Dict:
     """
     Format NDVI value with interpretation.
@@ -235,28 +382,9 @@ def format_ndvi(ndvi: float) -> Dict:
         Dictionary with formatted NDVI information
     """
     if ndvi is None:
-        return {
-            'value': None,
-            'formatted': 'N/A',
-            'interpretation': 'No data available',
-            'color': '#95a5a6',
-        }
+        return dict(_NDVI_MISSING)
     
-    if ndvi < 0.1:
-        interpretation = 'Bare soil / Water'
-        color = '#8b4513'
-    elif ndvi < 0.2:
-        interpretation = 'Sparse vegetation'
-        color = '#d4a574'
-    elif ndvi < 0.4:
-        interpretation = 'Moderate vegetation'
-        color = '#90EE90'
-    elif ndvi < 0.6:
-        interpretation = 'Dense vegetation'
-        color = '#228B22'
-    else:
-        interpretation = 'Very healthy vegetation'
-        color = '#006400'
+    interpretation, color = _NDVI_META[bisect_right(_NDVI_CUTS, ndvi)]
     
     return {
         'value': ndvi,
@@ -266,6 +394,31 @@ def format_ndvi(ndvi: float) -> Dict:
     }
 
 
+def format_ndvi_array(ndvi) -> Tuple:
+    """
+    Vectorized NDVI band lookup for rasters or batches of values.
+    
+    Args:
+        ndvi: Array-like of NDVI values; NaN marks missing data
+        
+    Returns:
+        Tuple of (interpretations, colors) string arrays shaped like ndvi
+    """
+    import numpy as np
+    
+    ndvi = np.asarray(ndvi, dtype=np.float64)
+    interpretations = np.array([meta[0] for meta in _NDVI_META])
+    colors = np.array([meta[1] for meta in _NDVI_META])
+    
+    idx = np.searchsorted(_NDVI_CUTS, ndvi, side='right')
+    missing = np.isnan(ndvi)
+    
+    return (
+        np.where(missing, _NDVI_MISSING['interpretation'], interpretations[idx]),
+        np.where(missing, _NDVI_MISSING['color'], colors[idx]),
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # DATE & TIME UTILITIES
 # ─────────────────────────────────────────────────────────────────────────────
@@ -277,24 +430,34 @@ def get_current_season() -> Dict:
     Returns:
         Dictionary with season information
     """
-    month = datetime.now().month
-    
+    return dict(_season_for_month(time.localtime().tm_mon))
+
+
+@lru_cache(maxsize=12)
+def _season_for_month(month: int) -> Mapping:
+    """Season information for a calendar month, built once per month."""
     if 5 <= month <= 11:
-        return {
+        return MappingProxyType({
             'name': 'Kharif (Rice)',
             'crop': 'Rice',
             'icon': '🌾',
             'months': 'May - November',
             'status': 'Active' if 5 <= month <= 10 else 'Harvesting',
-        }
+        })
     else:
-        return {
+        return MappingProxyType({
             'name': 'Rabi (Wheat)',
             'crop': 'Wheat',
             'icon': '🌿',
             'months': 'November - April',
-            'status': 'Active' if month in [12, 1, 2, 3] else 'Harvesting',
-        }
+            'status': 'Active' if month in (12, 1, 2, 3) else 'Harvesting',
+        })
+
+
+_DATE_FORMATS = MappingProxyType({
+    'full': '%B %d, %Y at %I:%M %p',
+    'short': '%b %d, %Y',
+})
 
 
 def format_date(date: datetime, format_type: str = 'full') -> str:
@@ -308,36 +471,45 @@ def format_date(date: datetime, format_type: str = 'full') -> str:
     Returns:
         Formatted date string
     """
-    formats = {
-        'full': '%B %d, %Y at %I:%M %p',
-        'short': '%b %d, %Y',
-        'date_only': '%Y-%m-%d',
-    }
-    return date.strftime(formats.get(format_type, formats['full']))
+    if format_type == 'date_only':
+        # Same as strftime('%Y-%m-%d') without the locale machinery
+        return date.isoformat()[:10]
+    return date.strftime(_DATE_FORMATS.get(format_type, _DATE_FORMATS['full']))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # FILE PATH UTILITIES
 # ─────────────────────────────────────────────────────────────────────────────
 
-def get_project_paths() -> Dict[str, Path]:
+# Resolved once at import; the layout does not change while the app runs
+_PATHS = MappingProxyType({
+    'root': PROJECT_ROOT,
+    'src': PROJECT_ROOT / 'src',
+    'app': PROJECT_ROOT / 'app',
+    'models': PROJECT_ROOT / 'models',
+    'credentials': PROJECT_ROOT / 'credentials',
+    'outputs': PROJECT_ROOT / 'outputs',
+    'logs': PROJECT_ROOT / 'outputs' / 'logs',
+})
+
+_MODEL_V4_PATH = _PATHS['models'] / 'best_model_v4.pth'
+_MODEL_V6_PATH = _PATHS['models'] / 'best_model_v6_variable.pth'
+_CREDENTIALS_PATH = _PATHS['credentials'] / 'gee_service_account.json'
+
+_MODEL_FILES = MappingProxyType({
+    'v4': _MODEL_V4_PATH,
+    'v6': _MODEL_V6_PATH,
+})
+
+
+def get_project_paths() -> Mapping[str, Path]:
     """
     Get important project paths.
     
     Returns:
-        Dictionary of path names to Path objects
+        Read-only mapping of path names to Path objects
     """
-    project_root = Path(__file__).parent.parent.parent
-    
-    return {
-        'root': project_root,
-        'src': project_root / 'src',
-        'app': project_root / 'app',
-        'models': project_root / 'models',
-        'credentials': project_root / 'credentials',
-        'outputs': project_root / 'outputs',
-        'logs': project_root / 'outputs' / 'logs',
-    }
+    return _PATHS
 
 
 def check_model_files() -> Dict[str, bool]:
@@ -347,12 +519,10 @@ def check_model_files() -> Dict[str, bool]:
     Returns:
         Dictionary of model names to existence status
     """
-    paths = get_project_paths()
-    
     return {
-        'v4_model': (paths['models'] / 'best_model_v4.pth').exists(),
-        'v6_model': (paths['models'] / 'best_model_v6_variable.pth').exists(),
-        'gee_credentials': (paths['credentials'] / 'gee_service_account.json').exists(),
+        'v4_model': _MODEL_V4_PATH.exists(),
+        'v6_model': _MODEL_V6_PATH.exists(),
+        'gee_credentials': _CREDENTIALS_PATH.exists(),
     }
 
 
@@ -366,14 +536,7 @@ def get_model_path(model_name: str) -> Optional[Path]:
     Returns:
         Path object or None if not found
     """
-    paths = get_project_paths()
-    
-    model_files = {
-        'v4': paths['models'] / 'best_model_v4.pth',
-        'v6': paths['models'] / 'best_model_v6_variable.pth',
-    }
-    
-    path = model_files.get(model_name)
+    path = _MODEL_FILES.get(model_name)
     if path and path.exists():
         return path
     return None
@@ -386,11 +549,8 @@ def get_credentials_path() -> Optional[Path]:
     Returns:
         Path object or None if not found
     """
-    paths = get_project_paths()
-    cred_path = paths['credentials'] / 'gee_service_account.json'
-    
-    if cred_path.exists():
-        return cred_path
+    if _CREDENTIALS_PATH.exists():
+        return _CREDENTIALS_PATH
     return None
 
 
@@ -398,7 +558,7 @@ def get_credentials_path() -> Optional[Path]:
 # ERROR MESSAGES
 # ─────────────────────────────────────────────────────────────────────────────
 
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     'no_coordinates': "Please enter valid coordinates to analyze.",
     'invalid_coordinates': "Invalid coordinates. Please check your input.",
     'outside_region': "Location is outside the supported region (Punjab, Pakistan).",
@@ -407,7 +567,9 @@ ERROR_MESSAGES = {
     'gee_auth_failed': "Failed to authenticate with Google Earth Engine. Check credentials.",
     'insufficient_data': "Insufficient satellite data for reliable classification.",
     'processing_error': "An error occurred during processing. Please try again.",
-}
+})
+
+_UNKNOWN_ERROR = "An unknown error occurred."
 
 
 def get_error_message(error_key: str, details: str = None) -> str:
@@ -421,24 +583,34 @@ def get_error_message(error_key: str, details: str = None) -> str:
     Returns:
         Formatted error message
     """
-    message = ERROR_MESSAGES.get(error_key, "An unknown error occurred.")
-    if details:
-        message += f"\n\nDetails: {details}"
-    return message
+    message = ERROR_MESSAGES.get(error_key, _UNKNOWN_ERROR)
+    return f"{message}\n\nDetails: {details}" if details else message
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # LOGGING UTILITIES
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _configure_logging() -> None:
+    """Configure logging on first use rather than at import."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
 def log_analysis_request(latitude: float, longitude: float, user_info: str = None):
     """Log an analysis request."""
-    logger.info(f"Analysis requested: ({latitude}, {longitude})")
+    _configure_logging()
+    logger.info("Analysis requested: (%s, %s)", latitude, longitude)
     if user_info:
-        logger.info(f"User info: {user_info}")
+        logger.info("User info: %s", user_info)
 
 
 def log_analysis_result(result: Dict):
     """Log analysis result summary."""
-    logger.info(f"Analysis complete: {result.get('predicted_class', 'N/A')} "
-                f"({result.get('confidence', 0):.1%} confidence)")
+    _configure_logging()
+    logger.info("Analysis complete: %s (%.1f%% confidence)",
+                result.get('predicted_class', 'N/A'),
+                result.get('confidence', 0) * 100)
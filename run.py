@@ -5,6 +5,7 @@
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 
@@ -20,12 +21,11 @@ def check_dependencies():
         'Pillow': 'PIL',  # Pillow imports as 'PIL'
     }
     
-    missing = []
-    for package_name, import_name in required.items():
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing.append(package_name)
+    # find_spec only locates each package; it does not run torch/ee init code
+    missing = [
+        package_name for package_name, import_name in required.items()
+        if importlib.util.find_spec(import_name) is None
+    ]
     
     if missing:
         print("❌ Missing dependencies:")
@@ -37,6 +37,25 @@ def check_dependencies():
     return True
 
 
+def _scan_present(project_root, file_paths):
+    """Return the subset of file_paths that exist, with one scandir per directory."""
+    listings = {}
+    present = set()
+    
+    for file_path in file_paths:
+        dirname, _, name = file_path.rpartition('/')
+        if dirname not in listings:
+            try:
+                with os.scandir(project_root / dirname) as entries:
+                    listings[dirname] = {entry.name for entry in entries}
+            except OSError:
+                listings[dirname] = set()
+        if name in listings[dirname]:
+            present.add(file_path)
+    
+    return present
+
+
 def check_files():
     """Check if required files exist."""
     project_root = Path(__file__).parent
@@ -59,12 +78,13 @@ def check_files():
         'credentials/gee_service_account.json': 'GEE Service Account',
     }
     
+    present = _scan_present(project_root, [*required_files, *optional_files])
+    
     print("\n📋 Checking required files...")
     all_present = True
     
     for file_path, description in required_files.items():
-        full_path = project_root / file_path
-        if full_path.exists():
+        if file_path in present:
             print(f"   ✅ {description}")
         else:
             print(f"   ❌ {description} (missing: {file_path})")
@@ -72,8 +92,7 @@ def check_files():
     
     print("\n📋 Checking optional files...")
     for file_path, description in optional_files.items():
-        full_path = project_root / file_path
-        if full_path.exists():
+        if file_path in present:
             print(f"   ✅ {description}")
         else:
             print(f"   ⚠️  {description} (missing: {file_path})")
@@ -0,0 +1,42 @@
+# ╔═══════════════════════════════════════════════════════════════════════════╗
+# ║                         ADVISORY RECOMMENDATIONS                          ║
+# ╚═══════════════════════════════════════════════════════════════════════════╝
+
+# Recommendation text for AdvisoryConfig. Kept out of config.py so that
+# importing the configuration does not parse these tables; config loads
+# this module on first access to the advisory attributes.
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CROP RECOMMENDATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Rice recommendations (same as before - truncated for brevity)
+RICE_ADVISORY = {
+    'water_stress': {
+        'Transplanting': [
+            "Maintain 2-5 cm standing water in the field",
+            "Ensure proper bund maintenance to prevent water loss",
+        ],
+    },
+}
+
+# Wheat recommendations (same as before)
+WHEAT_ADVISORY = {
+    'water_stress': {
+        'Sowing / Germination': [
+            "Apply pre-sowing irrigation (rauni) for proper germination",
+        ],
+    },
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# GENERAL RECOMMENDATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+
+GENERAL_ADVISORY = {
+    'healthy': [
+        "Crop appears healthy - continue regular monitoring",
+    ],
+}
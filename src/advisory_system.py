@@ -2,9 +2,11 @@
 # ║                             ADVISORY SYSTEM                               ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
 
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from functools import lru_cache
 import logging
+import re
+import time
 
 from config import AdvisoryConfig, TemporalConfig, HealthConfig
 
@@ -13,6 +15,363 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# STATIC ADVICE
+# ─────────────────────────────────────────────────────────────────────────────
+
+_RICE_STAGE_ADVICE = {
+    'Land Preparation / Nursery': (
+        "Ensure nursery bed is well-leveled and puddled",
+        "Use certified seed at 20-25 kg/acre for nursery",
+    ),
+    'Transplanting': (
+        "Transplant 25-30 day old seedlings",
+        "Maintain 2-3 seedlings per hill, 20×15 cm spacing",
+    ),
+    'Tillering': (
+        "This is the critical stage for yield determination",
+        "Monitor for stem borer damage (dead hearts)",
+    ),
+    'Tillering / Panicle Initiation': (
+        "Nitrogen application critical at panicle initiation",
+        "Maintain adequate water level",
+    ),
+    'Flowering / Grain Filling': (
+        "Avoid water stress - most critical stage",
+        "Monitor for neck blast disease",
+    ),
+    'Grain Filling / Maturity': (
+        "Begin draining field 10-15 days before harvest",
+        "Monitor grain moisture for harvest timing",
+    ),
+    'Harvesting': (
+        "Harvest when 80-85% grains are golden yellow",
+        "Avoid delays to prevent shattering losses",
+    ),
+}
+
+_WHEAT_STAGE_ADVICE = {
+    'Sowing / Germination': (
+        "Optimal sowing time: Nov 1-20 for timely varieties",
+        "Use seed rate 40-50 kg/acre",
+    ),
+    'Seedling / Crown Root': (
+        "First irrigation 21-25 days after sowing (crown root stage)",
+        "Monitor for termite damage in sandy soils",
+    ),
+    'Tillering': (
+        "Critical stage for yield potential",
+        "Apply first nitrogen dose with irrigation",
+    ),
+    'Stem Extension / Booting': (
+        "Monitor for rust diseases in humid conditions",
+        "Second irrigation at jointing stage",
+    ),
+    'Heading / Flowering': (
+        "Most critical stage for grain number",
+        "Avoid any stress during this period",
+    ),
+    'Grain Filling / Maturity': (
+        "Last irrigation at milking stage",
+        "Monitor for lodging in high-yielding varieties",
+    ),
+}
+
+# Added for severity >= 2 (severe or critical)
+_SEVERE_GENERIC_RICE = (
+    "🚨 Immediate field inspection recommended",
+    "Consider consulting local agricultural extension officer",
+    "Document affected areas for insurance/support purposes",
+)
+
+_SEVERE_GENERIC_WHEAT = (
+    "🚨 Immediate field inspection recommended",
+    "Consider consulting local agricultural extension officer",
+    "Check for visual symptoms of disease or pest damage",
+)
+
+
+# Stress type by deviation band: >= -10%, -10% to -20%, below -20%.
+# Moderate deviation may indicate nutrients; large negative deviation
+# often indicates water stress.
+_STRESS_BY_DEVIATION = ('general', 'nutrient_deficiency', 'water_stress')
+
+
+# Per-crop (stage advice, severe-stress extras); stress advice comes from
+# AdvisoryConfig.get_advice. A new crop only needs an entry here.
+_CROP_TABLES = {
+    'Rice': (_RICE_STAGE_ADVICE, _SEVERE_GENERIC_RICE),
+    'Wheat': (_WHEAT_STAGE_ADVICE, _SEVERE_GENERIC_WHEAT),
+}
+
+# General advice for health statuses missing from GENERAL_ADVISORY
+_GENERAL_FALLBACK = (
+    "Continue monitoring crop condition",
+    "Consult local agricultural expert if concerned",
+)
+
+# Fallback tips for crops or stages without stage-specific advice
+_DEFAULT_QUICK_TIPS = (
+    "Monitor crop condition regularly",
+    "Ensure adequate irrigation based on weather",
+    "Scout for pests and diseases weekly",
+)
+
+# Full summary sentence per health status, filled in with one format pass
+_SUMMARY_PREFIX = "Your {crop} crop at {stage} stage "
+_SUMMARY_SEVERE_TAIL = " Current NDVI ({ndvi:.2f}) indicates significant issues. Immediate action recommended."
+
+_SUMMARY_TEMPLATES = {
+    'healthy': _SUMMARY_PREFIX + "is healthy and developing normally."
+               " Current NDVI ({ndvi:.2f}) indicates good vegetation health. Continue regular monitoring.",
+    'moderate_stress': _SUMMARY_PREFIX + "is showing signs of moderate stress."
+                       " Current NDVI ({ndvi:.2f}) is below optimal. Review recommendations below.",
+    'severe_stress': _SUMMARY_PREFIX + "is experiencing severe stress." + _SUMMARY_SEVERE_TAIL,
+    'critical': _SUMMARY_PREFIX + "is in critical condition." + _SUMMARY_SEVERE_TAIL,
+}
+_SUMMARY_FALLBACK = _SUMMARY_PREFIX + "needs attention." + _SUMMARY_SEVERE_TAIL
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RECOMMENDATION CLASSIFICATION
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Priorities are carried as int ranks (lower sorts first) and only turned
+# back into names when the final advisory dict is built
+_PRIORITY_HIGH, _PRIORITY_MEDIUM, _PRIORITY_LOW = 0, 1, 2
+_PRIORITY_NAMES = ('high', 'medium', 'low')
+
+# One alternation with a named group per keyword class. None of the
+# keywords overlaps another, so a single finditer pass sees every one.
+_KEYWORD_PATTERN = re.compile(
+    r"(?P<urgent>immediate)|(?P<monitor>monitor|check)"
+    r"|(?P<apply>apply|use)|(?P<water>water|irrigation)"
+)
+
+
+def _classify_recommendation(recommendation: str) -> Tuple[str, int]:
+    """Return (icon, priority rank) for a recommendation based on its keywords."""
+    if not recommendation:
+        return '📋', _PRIORITY_LOW
+    if '🚨' in recommendation:
+        return '🚨', _PRIORITY_HIGH
+    
+    # Matches are collected first because precedence is by keyword class,
+    # not by position in the text
+    found = {match.lastgroup for match in _KEYWORD_PATTERN.finditer(recommendation.lower())}
+    
+    if 'urgent' in found:
+        return '🚨', _PRIORITY_HIGH
+    if 'monitor' in found:
+        return '👁️', _PRIORITY_MEDIUM
+    if 'apply' in found:
+        return ('💧' if 'water' in found else '🌿'), _PRIORITY_MEDIUM
+    return '📋', _PRIORITY_LOW
+
+
+def _iter_advisory_texts():
+    """Yield every static recommendation string known at import."""
+    for advisory in (AdvisoryConfig.RICE_ADVISORY, AdvisoryConfig.WHEAT_ADVISORY):
+        for stages in advisory.values():
+            for texts in stages.values():
+                yield from texts
+    for stage_advice, severe_generic in _CROP_TABLES.values():
+        for texts in stage_advice.values():
+            yield from texts
+        yield from severe_generic
+    for texts in AdvisoryConfig.GENERAL_ADVISORY.values():
+        yield from texts
+    yield from _GENERAL_FALLBACK
+
+
+# Static texts are classified once at import; anything else falls back
+# to _classify_recommendation
+_CLASSIFIED: Dict[str, Tuple[str, int]] = {
+    text: _classify_recommendation(text) for text in _iter_advisory_texts()
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# RECOMMENDATION RECORD
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Recommendation(NamedTuple):
+    """A formatted recommendation; converted to a dict only in the final advisory."""
+    rank: int
+    text: str
+    icon: str
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TIMESTAMPS
+# ─────────────────────────────────────────────────────────────────────────────
+
+# (epoch second, formatted) of the last timestamp handed out
+_TS_CACHE = (0, '')
+
+
+def _current_timestamp() -> str:
+    """Local 'YYYY-MM-DD HH:MM:SS' timestamp, formatted at most once per second."""
+    global _TS_CACHE
+    second = int(time.time())
+    if second != _TS_CACHE[0]:
+        _TS_CACHE = (second, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second)))
+    return _TS_CACHE[1]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ADVISORY BUILDING
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _severity_band(severity) -> int:
+    """Collapse severity to the three levels the advisory distinguishes."""
+    if severity >= 2:  # Severe or critical
+        return 2
+    return 1 if severity == 1 else 0
+
+
+def _get_crop_recommendations(crop: str,
+                              growth_stage: str,
+                              stress_type: str,
+                              severity: int) -> List[str]:
+    """Get recommendations for a crop listed in _CROP_TABLES."""
+    stage_advice, severe_generic = _CROP_TABLES[crop]
+    
+    # Get stress-specific recommendations
+    recommendations = list(AdvisoryConfig.get_advice(crop, stress_type, growth_stage))
+    
+    # Add severity-based general recommendations
+    if severity >= 2:  # Severe or critical
+        recommendations.extend(severe_generic)
+    
+    # Add growth-stage specific general advice
+    recommendations.extend(stage_advice.get(growth_stage, ()))
+    
+    return recommendations
+
+
+def _get_general_recommendations(status: str) -> List[str]:
+    """Get general recommendations when crop type is unknown."""
+    return AdvisoryConfig.GENERAL_ADVISORY.get(status, _GENERAL_FALLBACK)
+
+
+def _format_recommendation(recommendation: str) -> Recommendation:
+    """Format a single recommendation with metadata."""
+    # Assign icon based on content
+    classified = _CLASSIFIED.get(recommendation)
+    if classified is None:
+        classified = _classify_recommendation(recommendation)
+    icon, rank = classified
+    
+    # Only the urgent texts carry the emoji; skip the replace copy for the rest
+    if '🚨' in recommendation:
+        recommendation = recommendation.replace('🚨', '')
+    return Recommendation(rank, recommendation.strip(), icon)
+
+
+def _generate_summary(crop: str,
+                      growth_stage: str,
+                      status: str,
+                      ndvi: float) -> str:
+    """Generate a brief summary of the situation."""
+    template = _SUMMARY_TEMPLATES.get(status, _SUMMARY_FALLBACK)
+    return template.format(
+        crop=crop.lower() if crop else 'unknown',
+        stage=growth_stage.lower() if growth_stage else 'unknown',
+        ndvi=ndvi,
+    )
+
+
+def _create_action_plan(buckets: Tuple[List[Recommendation], ...],
+                        severity: int) -> Dict:
+    """Create a structured action plan from recommendations grouped by priority."""
+    immediate_actions = [r.text for r in buckets[_PRIORITY_HIGH]]
+    short_term_actions = [r.text for r in buckets[_PRIORITY_MEDIUM][:3]]
+    monitoring_actions = [r.text for r in buckets[_PRIORITY_LOW][:2]]
+    
+    if severity >= 2:
+        timeframe = "Take immediate action within 24-48 hours"
+    elif severity == 1:
+        timeframe = "Address within the next 3-5 days"
+    else:
+        timeframe = "Continue regular monitoring schedule"
+    
+    return {
+        'timeframe': timeframe,
+        'immediate': immediate_actions,
+        'short_term': short_term_actions,
+        'monitoring': monitoring_actions,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _build_advisory(crop: str,
+                    growth_stage: str,
+                    status: str,
+                    severity: int,
+                    stress_type: str,
+                    ndvi: float) -> Tuple:
+    """
+    Build the deterministic part of an advisory.
+    
+    Keyed only on what the output depends on: severity is passed as its
+    _severity_band and ndvi rounded to the 2 decimals the summary shows.
+    
+    Returns:
+        Tuple of (recommendations, summary, action_plan, high_count)
+        where recommendations is a tuple of Recommendation and
+        action_plan is a tuple of (key, value) pairs
+    """
+    # Get crop-specific recommendations
+    if crop in _CROP_TABLES:
+        recommendations = _get_crop_recommendations(
+            crop, growth_stage, stress_type, severity
+        )
+    else:
+        recommendations = _get_general_recommendations(status)
+    
+    # Format and group by priority rank; dict.fromkeys dedupes in order,
+    # and concatenating the buckets matches a stable sort by rank
+    buckets = ([], [], [])
+    for rec in dict.fromkeys(recommendations):
+        formatted = _format_recommendation(rec)
+        buckets[formatted.rank].append(formatted)
+    
+    formatted_recommendations = [r for bucket in buckets for r in bucket]
+    
+    # Generate summary
+    summary = _generate_summary(crop, growth_stage, status, ndvi)
+    
+    # Create action plan
+    action_plan = _create_action_plan(buckets, severity)
+    
+    return (
+        tuple(formatted_recommendations),
+        summary,
+        tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in action_plan.items()
+        ),
+        len(buckets[_PRIORITY_HIGH]),
+    )
+
+
+def _batch_label(value):
+    """Label as generate_advisory would see it; numpy strings become str."""
+    return value if value is None else str(value)
+
+
+@lru_cache(maxsize=128)
+def _build_quick_tips(crop: str, month: int) -> Tuple[str, ...]:
+    """Build the quick tips for a crop and month."""
+    growth_stage = TemporalConfig.get_growth_stage(crop, month)
+    
+    tables = _CROP_TABLES.get(crop)
+    tips = tables[0].get(growth_stage, ()) if tables is not None else ()
+    
+    return tuple(tips) if tips else _DEFAULT_QUICK_TIPS
+
+
 class AdvisorySystem:
     """
     Generates actionable recommendations for farmers based on:
@@ -24,6 +383,8 @@ class AdvisorySystem:
     Future enhancement: Weather API integration for weather-based recommendations
     """
     
+    __slots__ = ('advisory_config', 'temporal_config')
+    
     def __init__(self):
         """Initialize advisory system."""
         self.advisory_config = AdvisoryConfig
@@ -40,165 +401,11 @@ class AdvisorySystem:
         
         For now, uses simplified heuristics.
         """
-        ndvi = health_result.get('current_ndvi', 0)
         deviation = health_result.get('deviation_percent', 0)
         
-        # Simple heuristic - in production, this would be more sophisticated
-        if deviation < -20:
-            return 'water_stress'  # Large negative deviation often indicates water stress
-        elif deviation < -10:
-            return 'nutrient_deficiency'  # Moderate deviation may indicate nutrients
-        else:
-            return 'general'
-    
-    def _get_rice_recommendations(self, 
-                                   growth_stage: str, 
-                                   stress_type: str,
-                                   severity: int) -> List[str]:
-        """Get recommendations specific to rice crop."""
-        recommendations = []
-        
-        # Get stress-specific recommendations
-        if stress_type in AdvisoryConfig.RICE_ADVISORY:
-            stage_recommendations = AdvisoryConfig.RICE_ADVISORY[stress_type]
-            if growth_stage in stage_recommendations:
-                recommendations.extend(stage_recommendations[growth_stage])
-        
-        # Add severity-based general recommendations
-        if severity >= 2:  # Severe or critical
-            recommendations.extend([
-                "🚨 Immediate field inspection recommended",
-                "Consider consulting local agricultural extension officer",
-                "Document affected areas for insurance/support purposes",
-            ])
-        
-        # Add growth-stage specific general advice
-        stage_advice = self._get_rice_stage_advice(growth_stage)
-        recommendations.extend(stage_advice)
-        
-        return recommendations
-    
-    def _get_wheat_recommendations(self, 
-                                    growth_stage: str, 
-                                    stress_type: str,
-                                    severity: int) -> List[str]:
-        """Get recommendations specific to wheat crop."""
-        recommendations = []
-        
-        # Get stress-specific recommendations
-        if stress_type in AdvisoryConfig.WHEAT_ADVISORY:
-            stage_recommendations = AdvisoryConfig.WHEAT_ADVISORY[stress_type]
-            if growth_stage in stage_recommendations:
-                recommendations.extend(stage_recommendations[growth_stage])
-        
-        # Add severity-based general recommendations
-        if severity >= 2:
-            recommendations.extend([
-                "🚨 Immediate field inspection recommended",
-                "Consider consulting local agricultural extension officer",
-                "Check for visual symptoms of disease or pest damage",
-            ])
-        
-        # Add growth-stage specific general advice
-        stage_advice = self._get_wheat_stage_advice(growth_stage)
-        recommendations.extend(stage_advice)
-        
-        return recommendations
-    
-    def _get_rice_stage_advice(self, growth_stage: str) -> List[str]:
-        """Get general advice for rice growth stage."""
-        advice = {
-            'Land Preparation / Nursery': [
-                "Ensure nursery bed is well-leveled and puddled",
-                "Use certified seed at 20-25 kg/acre for nursery",
-            ],
-            'Transplanting': [
-                "Transplant 25-30 day old seedlings",
-                "Maintain 2-3 seedlings per hill, 20×15 cm spacing",
-            ],
-            'Tillering': [
-                "This is the critical stage for yield determination",
-                "Monitor for stem borer damage (dead hearts)",
-            ],
-            'Tillering / Panicle Initiation': [
-                "Nitrogen application critical at panicle initiation",
-                "Maintain adequate water level",
-            ],
-            'Flowering / Grain Filling': [
-                "Avoid water stress - most critical stage",
-                "Monitor for neck blast disease",
-            ],
-            'Grain Filling / Maturity': [
-                "Begin draining field 10-15 days before harvest",
-                "Monitor grain moisture for harvest timing",
-            ],
-            'Harvesting': [
-                "Harvest when 80-85% grains are golden yellow",
-                "Avoid delays to prevent shattering losses",
-            ],
-        }
-        return advice.get(growth_stage, [])
-    
-    def _get_wheat_stage_advice(self, growth_stage: str) -> List[str]:
-        """Get general advice for wheat growth stage."""
-        advice = {
-            'Sowing / Germination': [
-                "Optimal sowing time: Nov 1-20 for timely varieties",
-                "Use seed rate 40-50 kg/acre",
-            ],
-            'Seedling / Crown Root': [
-                "First irrigation 21-25 days after sowing (crown root stage)",
-                "Monitor for termite damage in sandy soils",
-            ],
-            'Tillering': [
-                "Critical stage for yield potential",
-                "Apply first nitrogen dose with irrigation",
-            ],
-            'Stem Extension / Booting': [
-                "Monitor for rust diseases in humid conditions",
-                "Second irrigation at jointing stage",
-            ],
-            'Heading / Flowering': [
-                "Most critical stage for grain number",
-                "Avoid any stress during this period",
-            ],
-            'Grain Filling / Maturity': [
-                "Last irrigation at milking stage",
-                "Monitor for lodging in high-yielding varieties",
-            ],
-        }
-        return advice.get(growth_stage, [])
-    
-    def _get_general_recommendations(self, status: str, severity: int) -> List[str]:
-        """Get general recommendations when crop type is unknown."""
-        return AdvisoryConfig.GENERAL_ADVISORY.get(status, [
-            "Continue monitoring crop condition",
-            "Consult local agricultural expert if concerned",
-        ])
-    
-    def _format_recommendation(self, 
-                                recommendation: str, 
-                                priority: str) -> Dict:
-        """Format a single recommendation with metadata."""
-        # Assign icon based on content
-        if recommendation and ('🚨' in recommendation or 'immediate' in recommendation.lower()):
-            icon = '🚨'
-            rec_priority = 'high'
-        elif recommendation and ('monitor' in recommendation.lower() or 'check' in recommendation.lower()):
-            icon = '👁️'
-            rec_priority = 'medium'
-        elif recommendation and ('apply' in recommendation.lower() or 'use' in recommendation.lower()):
-            icon = '💧' if recommendation and ('water' in recommendation.lower() or 'irrigation' in recommendation.lower()) else '🌿'
-            rec_priority = 'medium'
-        else:
-            icon = '📋'
-            rec_priority = 'low'
-        
-        return {
-            'text': recommendation.replace('🚨', '').strip(),
-            'icon': icon,
-            'priority': rec_priority,
-        }
+        # Simple heuristic - in production, this would be more sophisticated.
+        # Each threshold crossed moves one step along _STRESS_BY_DEVIATION.
+        return _STRESS_BY_DEVIATION[(deviation < -10) + (deviation < -20)]
     
     def generate_advisory(self,
                           crop: str,
@@ -224,97 +431,119 @@ class AdvisorySystem:
         # Determine stress type
         stress_type = self._get_stress_type(health_result)
         
-        # Get crop-specific recommendations
-        if crop == 'Rice':
-            recommendations = self._get_rice_recommendations(growth_stage, stress_type, severity)
-        elif crop == 'Wheat':
-            recommendations = self._get_wheat_recommendations(growth_stage, stress_type, severity)
-        else:
-            recommendations = self._get_general_recommendations(status, severity)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec not in seen:
-                seen.add(rec)
-                unique_recommendations.append(rec)
+        # The summary only shows NDVI to 2 decimals, so that is the cache key
+        advisory = self._assemble_advisory(
+            crop, growth_stage, status, stress_type,
+            _build_advisory(
+                crop, growth_stage, status, _severity_band(severity),
+                stress_type, round(ndvi, 2)
+            )
+        )
         
-        # Format recommendations
-        formatted_recommendations = [
-            self._format_recommendation(rec, health_result.get('priority', 'low'))
-            for rec in unique_recommendations
-        ]
+        logger.info(f"Generated advisory with {advisory['total_recommendations']} recommendations")
         
-        # Sort by priority
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        formatted_recommendations.sort(key=lambda x: priority_order.get(x['priority'], 3))
+        return advisory
+    
+    def generate_advisory_batch(self,
+                                crops,
+                                growth_stages,
+                                ndvi,
+                                deviation,
+                                status,
+                                severity,
+                                priority=None) -> List[Dict]:
+        """
+        Generate advisories for many fields or pixels at once.
         
-        # Generate summary
-        summary = self._generate_summary(crop, growth_stage, status, ndvi)
+        Stress types are computed with numpy over the whole batch, and an
+        advisory is only built once per unique combination of inputs.
         
-        # Create action plan
-        action_plan = self._create_action_plan(formatted_recommendations, severity)
+        Args:
+            crops: Crop type per row
+            growth_stages: Growth stage per row
+            ndvi: Current NDVI per row (rounded to 2 decimals with numpy)
+            deviation: NDVI deviation percent per row
+            status: Health status per row
+            severity: Health severity per row
+            priority: Accepted for compatibility; priority does not change
+                the advisory
+            
+        Returns:
+            List of advisory dictionaries in row order, one per row
+        """
+        import numpy as np
+        
+        deviation = np.asarray(deviation, dtype=np.float64)
+        
+        # Same bands as _get_stress_type, for the whole batch
+        stress_idx = (deviation < -10).astype(np.int64) + (deviation < -20).astype(np.int64)
+        ndvi_cents = np.rint(np.round(np.asarray(ndvi, dtype=np.float64), 2) * 100).astype(np.int64)
+        
+        # Severity banded as in _severity_band, so rows that only differ in
+        # an irrelevant severity level share one advisory
+        severity = np.asarray(severity, dtype=np.int64)
+        severity_band = np.where(severity >= 2, 2, (severity == 1).astype(np.int64))
+        
+        # Label columns are coded in Python rather than with np.unique on a
+        # str array, which would turn None into the string 'None'
+        columns = [stress_idx, ndvi_cents, severity_band]
+        labels = []
+        for values in (crops, growth_stages, status):
+            codes = {}
+            ids = [codes.setdefault(_batch_label(v), len(codes)) for v in values]
+            labels.append(list(codes))
+            columns.append(np.asarray(ids, dtype=np.int64))
+        
+        combos, inverse = np.unique(np.stack(columns, axis=1), axis=0, return_inverse=True)
+        
+        built = []
+        for stress, cents, sev, crop_id, stage_id, status_id in combos.tolist():
+            crop = labels[0][crop_id]
+            growth_stage = labels[1][stage_id]
+            row_status = labels[2][status_id]
+            stress_type = _STRESS_BY_DEVIATION[stress]
+            built.append((
+                crop, growth_stage, row_status, stress_type,
+                _build_advisory(
+                    crop, growth_stage, row_status, sev,
+                    stress_type, cents / 100
+                )
+            ))
+        
+        logger.info(f"Generated {len(built)} unique advisories for {len(inverse)} rows")
+        
+        # One dict per row, so editing one row's advisory leaves the others alone
+        return [self._assemble_advisory(*built[i]) for i in inverse.reshape(-1)]
+    
+    def _assemble_advisory(self,
+                           crop: str,
+                           growth_stage: str,
+                           status: str,
+                           stress_type: str,
+                           cached: Tuple) -> Dict:
+        """Turn a cached _build_advisory result into a fresh advisory dict."""
+        recommendations, summary, action_plan, high_count = cached
+        
+        # Rebuild fresh containers so callers never mutate cached data
+        formatted_recommendations = [
+            {'text': rec.text, 'icon': rec.icon, 'priority': _PRIORITY_NAMES[rec.rank]}
+            for rec in recommendations
+        ]
         
-        advisory = {
+        return {
             'summary': summary,
             'crop': crop,
             'growth_stage': growth_stage,
             'health_status': status,
             'stress_type': stress_type,
             'recommendations': formatted_recommendations,
-            'action_plan': action_plan,
-            'total_recommendations': len(formatted_recommendations),
-            'high_priority_count': sum(1 for r in formatted_recommendations if r['priority'] == 'high'),
-            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        }
-        
-        logger.info(f"Generated advisory with {len(formatted_recommendations)} recommendations")
-        
-        return advisory
-    
-    def _generate_summary(self, 
-                          crop: str, 
-                          growth_stage: str, 
-                          status: str, 
-                          ndvi: float) -> str:
-        """Generate a brief summary of the situation."""
-        status_text = {
-            'healthy': 'is healthy and developing normally',
-            'moderate_stress': 'is showing signs of moderate stress',
-            'severe_stress': 'is experiencing severe stress',
-            'critical': 'is in critical condition',
-        }
-        
-        base_summary = f"Your {(crop.lower() if crop else 'unknown')} crop at {(growth_stage.lower() if growth_stage else 'unknown')} stage {status_text.get(status, 'needs attention')}."
-        
-        if status == 'healthy':
-            return f"{base_summary} Current NDVI ({ndvi:.2f}) indicates good vegetation health. Continue regular monitoring."
-        elif status == 'moderate_stress':
-            return f"{base_summary} Current NDVI ({ndvi:.2f}) is below optimal. Review recommendations below."
-        else:
-            return f"{base_summary} Current NDVI ({ndvi:.2f}) indicates significant issues. Immediate action recommended."
-    
-    def _create_action_plan(self, 
-                            recommendations: List[Dict], 
-                            severity: int) -> Dict:
-        """Create a structured action plan."""
-        immediate_actions = [r['text'] for r in recommendations if r['priority'] == 'high']
-        short_term_actions = [r['text'] for r in recommendations if r['priority'] == 'medium'][:3]
-        monitoring_actions = [r['text'] for r in recommendations if r['priority'] == 'low'][:2]
-        
-        if severity >= 2:
-            timeframe = "Take immediate action within 24-48 hours"
-        elif severity == 1:
-            timeframe = "Address within the next 3-5 days"
-        else:
-            timeframe = "Continue regular monitoring schedule"
-        
-        return {
-            'timeframe': timeframe,
-            'immediate': immediate_actions,
-            'short_term': short_term_actions,
-            'monitoring': monitoring_actions,
+            'action_plan': {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in action_plan
+            },
+            'total_recommendations': len(recommendations),
+            'high_priority_count': high_count,
+            'generated_at': _current_timestamp(),
         }
     
     def get_quick_tips(self, crop: str, month: int) -> List[str]:
@@ -329,29 +558,17 @@ class AdvisorySystem:
         Returns:
             List of quick tips
         """
-        growth_stage = TemporalConfig.get_growth_stage(crop, month)
-        
-        tips = []
-        
-        if crop == 'Rice':
-            tips = self._get_rice_stage_advice(growth_stage)
-        elif crop == 'Wheat':
-            tips = self._get_wheat_stage_advice(growth_stage)
-        
-        if not tips:
-            tips = [
-                "Monitor crop condition regularly",
-                "Ensure adequate irrigation based on weather",
-                "Scout for pests and diseases weekly",
-            ]
-        
-        return tips
+        return list(_build_quick_tips(crop, month))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # WEATHER INTEGRATION PLACEHOLDER
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Shared empty result while weather integration is disabled
+_NO_WEATHER: Tuple[str, ...] = ()
+
+
 class WeatherAdvisory:
     """
     Placeholder for weather-based recommendations.
@@ -367,15 +584,15 @@ class WeatherAdvisory:
     def get_weather_recommendations(self, 
                                      latitude: float, 
                                      longitude: float,
-                                     crop: str) -> List[str]:
+                                     crop: str) -> Tuple[str, ...]:
         """
         Get weather-based recommendations.
-        Placeholder - returns empty list until weather API is integrated.
+        Placeholder - returns an empty tuple until weather API is integrated.
         """
         if not self.enabled:
-            return []
+            return _NO_WEATHER
         
-        return []
+        return _NO_WEATHER
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -2,15 +2,61 @@
 # ║                         CONFIGURATION FILE                                ║
 # ╚═══════════════════════════════════════════════════════════════════════════╝
 
-import os
-from datetime import datetime, date
-from typing import Dict, List, Tuple
+import sys
+import time
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SHARED CONSTANTS
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Module globals for hot paths (`from config import IMAGE_SIZE`); the
+# config classes below re-export them under the same names
+IMAGE_SIZE = (64, 64)
+NUM_BANDS = 4  # B2, B3, B4, B8
+NUM_MONTHS = 6
+NUM_CHANNELS = NUM_BANDS * NUM_MONTHS  # 24
+SCALE = 10  # Sentinel-2 resolution
+BUFFER_SIZE = 500  # Increased from 320 to 500 meters (~100 pixels at 10m)
+
+# Class labels in model output order, and the reverse index
+_CLASS_NAMES = ('Other', 'Rice', 'Wheat')
+_CLASS_TO_IDX = MappingProxyType({name: idx for idx, name in enumerate(_CLASS_NAMES)})
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LAZY TABLES
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _LazyTable:
+    """
+    Class attribute built on first access and then stored on the class,
+    so later reads are plain attribute lookups.
+    """
+    
+    def __init__(self, builder):
+        self._builder = builder
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+    
+    def __get__(self, instance, owner):
+        value = self._builder()
+        setattr(owner, self._name, value)
+        return value
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PATHS CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
 
 class PathConfig:
+    # Config classes are plain namespaces; no instance dict is ever needed
+    __slots__ = ()
         
     V4_MODEL_PATH = "models/best_model_v4.pth"
     V6_MODEL_PATH = "models/best_model_v6_variable.pth"
@@ -25,17 +71,18 @@ class PathConfig:
 # ─────────────────────────────────────────────────────────────────────────────
 
 class ModelConfig:
+    __slots__ = ()
     
-    IMAGE_SIZE = (64, 64)
-    NUM_BANDS = 4  # B2, B3, B4, B8
-    NUM_MONTHS = 6
-    NUM_CHANNELS = NUM_BANDS * NUM_MONTHS  # 24
+    IMAGE_SIZE = IMAGE_SIZE
+    NUM_BANDS = NUM_BANDS
+    NUM_MONTHS = NUM_MONTHS
+    NUM_CHANNELS = NUM_CHANNELS
     
     
-    CLASS_NAMES = ['Other', 'Rice', 'Wheat']
-    NUM_CLASSES = 3
-    CLASS_TO_IDX = {name: idx for idx, name in enumerate(CLASS_NAMES)}
-    IDX_TO_CLASS = {idx: name for idx, name in enumerate(CLASS_NAMES)}
+    CLASS_NAMES = _CLASS_NAMES
+    NUM_CLASSES = len(_CLASS_NAMES)
+    CLASS_TO_IDX = _CLASS_TO_IDX
+    IDX_TO_CLASS = _CLASS_NAMES  # indexed directly by class index
     
    
     MIN_MONTHS_FOR_V4 = 5  # Use V4 if >= 5 months available
@@ -45,23 +92,83 @@ class ModelConfig:
     HIGH_CONFIDENCE_THRESHOLD = 0.85
     MEDIUM_CONFIDENCE_THRESHOLD = 0.70
     LOW_CONFIDENCE_THRESHOLD = 0.50
+    
+    # Ascending (medium, high) cut-offs per data tier: fewer than 3 months,
+    # 3-4 months, and 5+ months; sparser stacks need more confidence
+    _CONF_LABELS = ('low', 'medium', 'high')
+    _CONF_THRESHOLDS_BY_TIER = (
+        (0.80, 0.95),
+        (0.75, 0.90),
+        (MEDIUM_CONFIDENCE_THRESHOLD, HIGH_CONFIDENCE_THRESHOLD),
+    )
+    
+    @classmethod
+    def classify_confidence(cls, confidence: float, months_available: int = NUM_MONTHS) -> str:
+        """Bucket a prediction confidence into 'low', 'medium' or 'high'."""
+        tier = (months_available >= 3) + (months_available >= 5)
+        return cls._CONF_LABELS[bisect_right(cls._CONF_THRESHOLDS_BY_TIER[tier], confidence)]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # DATE RANGE CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _today_for_second(second: int) -> date:
+    """date.today(), memoized per epoch second."""
+    return date.today()
+
+
+def _today() -> date:
+    """
+    Today's date, re-read from the clock at most once a second so the
+    value is never more than a second stale across midnight.
+    """
+    return _today_for_second(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _month_for_second(second: int) -> int:
+    """Local calendar month at an epoch second, read from struct_time."""
+    return time.localtime(second).tm_mon
+
+
+def _current_month() -> int:
+    """Current calendar month, re-read from the clock at most once a second."""
+    return _month_for_second(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _today_ordinal_for_second(second: int) -> int:
+    """Proleptic ordinal of today's date, memoized per epoch second."""
+    return _today_for_second(second).toordinal()
+
+
+def _today_ordinal() -> int:
+    """Ordinal of _today(), for plain integer date comparisons."""
+    return _today_ordinal_for_second(int(time.time()))
+
+
+@lru_cache(maxsize=2)
+def _years_through(last_year: int) -> Tuple[int, ...]:
+    """Years from DateConfig.MIN_DATE up to and including last_year."""
+    return tuple(range(DateConfig.MIN_DATE.year, last_year + 1))
+
+
 class DateConfig:
     """Date range and temporal settings."""
+    __slots__ = ()
     
     
     MIN_DATE = date(2022, 4, 1)  # April 2022
+    _MIN_ORDINAL = MIN_DATE.toordinal()
+    _BEFORE_MIN_MESSAGE = f"Date must be after {MIN_DATE.strftime('%B %Y')}"
     
     # Maximum date (today)
     @classmethod
     def get_max_date(cls) -> date:
         """Get maximum date (today)."""
-        return date.today()
+        return _today()
     
     @classmethod
     def get_min_date(cls) -> date:
@@ -71,31 +178,56 @@ class DateConfig:
     @classmethod
     def is_valid_date(cls, check_date: date) -> Tuple[bool, str]:
        
-        if check_date < cls.MIN_DATE:
-            return False, f"Date must be after {cls.MIN_DATE.strftime('%B %Y')}"
+        # Compare day ordinals as ints rather than date objects
+        ordinal = check_date.toordinal()
+        if ordinal < cls._MIN_ORDINAL:
+            return False, cls._BEFORE_MIN_MESSAGE
         
-        if check_date > date.today():
+        if ordinal > _today_ordinal():
             return False, "Date cannot be in the future"
         
         return True, "Valid date"
     
     @classmethod
     def get_available_years(cls) -> List[int]:
-        return list(range(cls.MIN_DATE.year, date.today().year + 1))
+        # Range is memoized per year; callers get their own list
+        return list(_years_through(_today().year))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # TEMPORAL CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _interned_stages(stages: Dict[int, str]) -> Mapping:
+    """
+    Freeze a month -> growth stage table with interned stage names, so
+    every table keyed by stage shares one object per name.
+    """
+    return MappingProxyType({month: sys.intern(stage) for month, stage in stages.items()})
+
+
+def _month_to_idx() -> Dict:
+    return {
+        'Rice': {month: idx for idx, month in enumerate(TemporalConfig.RICE_MONTHS)},
+        'Wheat': {month: idx for idx, month in enumerate(TemporalConfig.WHEAT_MONTHS)},
+    }
+
+
 class TemporalConfig:
+    __slots__ = ()
     
-    RICE_MONTHS = ['May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct']
-    WHEAT_MONTHS = ['Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr']
+    RICE_MONTHS = ('May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct')
+    WHEAT_MONTHS = ('Nov', 'Dec', 'Jan', 'Feb', 'Mar', 'Apr')
     
-    MONTH_TO_IDX = {
-        'Rice': {month: idx for idx, month in enumerate(RICE_MONTHS)},
-        'Wheat': {month: idx for idx, month in enumerate(WHEAT_MONTHS)},
+    # Month-name to slot index per crop; nothing on the hot path reads
+    # it, so it is only built if asked for
+    MONTH_TO_IDX = _LazyTable(_month_to_idx)
+    
+    # Temporal-stack slot per calendar month number (index 0 unused),
+    # -1 where the month falls outside the crop season
+    _MONTH_SLOTS = {
+        'Rice': (-1, -1, -1, -1, -1, 0, 1, 2, 3, 4, 5, -1, -1),
+        'Wheat': (-1, 2, 3, 4, 5, -1, -1, -1, -1, -1, -1, 0, 1),
     }
     
     
@@ -113,43 +245,77 @@ class TemporalConfig:
         'months': [11, 12, 1, 2, 3, 4],  # November to April
     }
     
+    # Hashed month membership per season; the 'months' lists above keep
+    # their calendar order for callers that iterate them
+    RICE_SEASON_MONTHS_SET = frozenset(RICE_SEASON['months'])
+    WHEAT_SEASON_MONTHS_SET = frozenset(WHEAT_SEASON['months'])
+    
+    # Season name per calendar month, resolved once at import
+    _SEASON_BY_MONTH = dict.fromkeys(range(1, 13), 'Wheat')
+    _SEASON_BY_MONTH.update(dict.fromkeys(RICE_SEASON_MONTHS_SET, 'Rice'))
+    
+    # Acceptance messages, one per (valid crop, season) pair
+    _VALID_CROP_MESSAGES = {
+        (crop, season): f"{crop} is valid for {season} season"
+        for season in ('Rice', 'Wheat')
+        for crop in (season, 'Other')
+    }
     
-    RICE_GROWTH_STAGES = {
+    # Season descriptions; get_season_info hands out copies
+    _RICE_SEASON_INFO = MappingProxyType({
+        'name': 'Rice (Kharif)',
+        'season': 'Rice',
+        'months': 'May - October',
+        'valid_crops': ('Rice', 'Other'),
+        'invalid_crops': ('Wheat',),
+        'icon': '🌾',
+        'color': '#27ae60',
+    })
+    _WHEAT_SEASON_INFO = MappingProxyType({
+        'name': 'Wheat (Rabi)',
+        'season': 'Wheat',
+        'months': 'November - April',
+        'valid_crops': ('Wheat', 'Other'),
+        'invalid_crops': ('Rice',),
+        'icon': '🌿',
+        'color': '#f39c12',
+    })
+    _SEASON_INFO = MappingProxyType({'Rice': _RICE_SEASON_INFO, 'Wheat': _WHEAT_SEASON_INFO})
+    
+    
+    RICE_GROWTH_STAGES = _interned_stages({
         5: 'Land Preparation / Nursery',
         6: 'Transplanting',
         7: 'Tillering',
         8: 'Tillering / Panicle Initiation',
         9: 'Flowering / Grain Filling',
         10: 'Grain Filling / Maturity',
-    }
+    })
     
-    WHEAT_GROWTH_STAGES = {
+    WHEAT_GROWTH_STAGES = _interned_stages({
         11: 'Sowing / Germination',
         12: 'Seedling / Crown Root',
         1: 'Tillering',
         2: 'Stem Extension / Booting',
         3: 'Heading / Flowering',
         4: 'Grain Filling / Maturity',
-    }
+    })
     
     @classmethod
-    def get_current_season(cls) -> str:
-
-        month = datetime.now().month
-        if month in cls.RICE_SEASON['months']:
-            return 'Rice'
-        else:
-            return 'Wheat'
+    def get_current_season(cls, month: int = None) -> str:
+        """Season for the given month, defaulting to the current month."""
+        if month is None:
+            month = _current_month()
+        return cls._SEASON_BY_MONTH.get(month, 'Wheat')
     
     @classmethod
     def get_season_for_month(cls, month: int) -> str:
         
-        if month in cls.RICE_SEASON['months']:
-            return 'Rice'
-        else:
-            return 'Wheat'
+        return cls._SEASON_BY_MONTH.get(month, 'Wheat')
     
+    # Memoized: the domain is a handful of crops x 12 months
     @classmethod
+    @lru_cache(maxsize=64)
     def get_growth_stage(cls, crop: str, month: int) -> str:
         
         if crop == 'Rice':
@@ -158,24 +324,36 @@ class TemporalConfig:
             return cls.WHEAT_GROWTH_STAGES.get(month, 'Off-season')
         return 'Unknown'
     
+    @classmethod
+    def get_month_idx(cls, crop: str, month: int) -> int:
+        """Slot of a calendar month in the crop's temporal stack, or -1."""
+        slots = cls._MONTH_SLOTS.get(crop)
+        if slots is None or not 1 <= month <= 12:
+            return -1
+        return slots[month]
+    
     @classmethod
     def get_valid_crops_for_season(cls, month: int) -> List[str]:
         
-        if month in cls.RICE_SEASON['months']:
-            # Rice season: Can classify Rice or Other (NOT Wheat)
-            return ['Rice', 'Other']
-        else:
-            # Wheat season: Can classify Wheat or Other (NOT Rice)
-            return ['Wheat', 'Other']
+        # Rice season: Rice or Other (NOT Wheat); Wheat season: Wheat or Other
+        season = cls._SEASON_BY_MONTH.get(month, 'Wheat')
+        return list(cls._SEASON_INFO[season]['valid_crops'])
     
     @classmethod
+    def is_crop_valid_for_season_bool(cls, crop: str, month: int) -> bool:
+        """is_crop_valid_for_season without building the message."""
+        # The valid crops for a season are the season crop and 'Other'
+        return crop == 'Other' or crop == cls._SEASON_BY_MONTH.get(month, 'Wheat')
+    
+    # Memoized: a few crops x 12 months, and the result tuple is immutable
+    @classmethod
+    @lru_cache(maxsize=64)
     def is_crop_valid_for_season(cls, crop: str, month: int) -> Tuple[bool, str]:
         
-        valid_crops = cls.get_valid_crops_for_season(month)
-        season = cls.get_season_for_month(month)
+        season = cls._SEASON_BY_MONTH.get(month, 'Wheat')
         
-        if crop in valid_crops:
-            return True, f"{crop} is valid for {season} season"
+        if crop == season or crop == 'Other':
+            return True, cls._VALID_CROP_MESSAGES[crop, season]
         else:
             return False, f"{crop} cannot be grown during {season} season (Month: {month})"
     
@@ -183,89 +361,131 @@ class TemporalConfig:
     def get_season_info(cls, month: int = None) -> Dict:
         
         if month is None:
-            month = datetime.now().month
-        
-        season = cls.get_season_for_month(month)
+            month = _current_month()
         
-        if season == 'Rice':
-            return {
-                'name': 'Rice (Kharif)',
-                'season': 'Rice',
-                'months': 'May - October',
-                'valid_crops': ['Rice', 'Other'],
-                'invalid_crops': ['Wheat'],
-                'icon': '🌾',
-                'color': '#27ae60',
-            }
-        else:
-            return {
-                'name': 'Wheat (Rabi)',
-                'season': 'Wheat',
-                'months': 'November - April',
-                'valid_crops': ['Wheat', 'Other'],
-                'invalid_crops': ['Rice'],
-                'icon': '🌿',
-                'color': '#f39c12',
-            }
+        info = cls._SEASON_INFO_BY_MONTH.get(month, cls._WHEAT_SEASON_INFO)
+        return {
+            **info,
+            'valid_crops': list(info['valid_crops']),
+            'invalid_crops': list(info['invalid_crops']),
+        }
+
+
+# Month -> season info in one step, pre-joined through _SEASON_BY_MONTH
+TemporalConfig._SEASON_INFO_BY_MONTH = MappingProxyType({
+    month: TemporalConfig._SEASON_INFO[season]
+    for month, season in TemporalConfig._SEASON_BY_MONTH.items()
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # GEE CONFIGURATION 
 # ─────────────────────────────────────────────────────────────────────────────
 
+class _Bounds(NamedTuple):
+    """Latitude/longitude bounding box."""
+    min_lat: float
+    max_lat: float
+    min_lon: float
+    max_lon: float
+
+
 class GEEConfig:
     """Google Earth Engine settings."""
+    __slots__ = ()
     
     # Sentinel-2 collection
     SENTINEL2_COLLECTION = 'COPERNICUS/S2_SR_HARMONIZED'
     
     # Bands to extract
-    BANDS = ['B2', 'B3', 'B4', 'B8']  # Blue, Green, Red, NIR
-    BAND_NAMES = {
+    BANDS = ('B2', 'B3', 'B4', 'B8')  # Blue, Green, Red, NIR
+    BAND_NAMES = MappingProxyType({
         'B2': 'Blue',
         'B3': 'Green', 
         'B4': 'Red',
         'B8': 'NIR',
-    }
+    })
     
     
     CLOUD_FILTER_PERCENT = 90  
     CLOUD_FILTER_PERCENT_FALLBACK = 95  
     
     # Scale (resolution in meters)
-    SCALE = 10  # Sentinel-2 resolution
+    SCALE = SCALE
     
     
-    BUFFER_SIZE = 500  # Increased from 320 to 500 meters (~100 pixels at 10m)
+    BUFFER_SIZE = BUFFER_SIZE
     BUFFER_SIZE_FALLBACK = 800  # Fallback larger buffer
     
+    # Months fetched concurrently; kept small to stay within GEE quotas
+    MAX_FETCH_WORKERS = 3
+    
     # Punjab, Pakistan bounding box (approximate)
-    PUNJAB_BOUNDS = {
+    PUNJAB_BOUNDS = MappingProxyType({
         'min_lon': 69.5,
         'max_lon': 75.5,
         'min_lat': 28.0,
         'max_lat': 34.0,
-    }
+    })
     
     
     DATE_RANGE_EXPANSION_DAYS = 7  
     
+    # Bounds as one float tuple; the checks below unpack it in a single
+    # attribute load instead of four dict lookups
+    _BOUNDS = _Bounds(
+        float(PUNJAB_BOUNDS['min_lat']), float(PUNJAB_BOUNDS['max_lat']),
+        float(PUNJAB_BOUNDS['min_lon']), float(PUNJAB_BOUNDS['max_lon']),
+    )
+    
     @classmethod
     def is_in_punjab(cls, lat: float, lon: float) -> bool:
         
-        return (cls.PUNJAB_BOUNDS['min_lat'] <= lat <= cls.PUNJAB_BOUNDS['max_lat'] and
-                cls.PUNJAB_BOUNDS['min_lon'] <= lon <= cls.PUNJAB_BOUNDS['max_lon'])
+        min_lat, max_lat, min_lon, max_lon = cls._BOUNDS
+        return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+    
+    @classmethod
+    def is_in_punjab_array(cls, lats, lons):
+        """
+        Vectorized is_in_punjab for arrays of coordinates.
+        
+        Args:
+            lats: Array-like of latitudes
+            lons: Array-like of longitudes (same shape as lats)
+            
+        Returns:
+            Boolean NumPy array, True where the point lies inside Punjab
+        """
+        import numpy as np
+        
+        min_lat, max_lat, min_lon, max_lon = cls._BOUNDS
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        return ((lats >= min_lat) & (lats <= max_lat) &
+                (lons >= min_lon) & (lons <= max_lon))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # NDVI THRESHOLDS FOR HEALTH ASSESSMENT
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _frozen_thresholds(table: Dict[str, Dict]) -> Mapping:
+    """
+    Freeze a growth stage -> thresholds table, interning stage keys to
+    match TemporalConfig's growth stages.
+    """
+    return MappingProxyType({
+        sys.intern(stage): MappingProxyType(v) for stage, v in table.items()
+    })
+
+
 class HealthConfig:
+    __slots__ = ()
     
     
-    # Rice NDVI thresholds by growth stage
-    RICE_NDVI = {
+    # Rice NDVI thresholds by growth stage. Frozen so get_ndvi_thresholds
+    # can hand out the tables by reference
+    RICE_NDVI = _frozen_thresholds({
         'Land Preparation / Nursery': {
             'healthy_min': 0.15,
             'stress_threshold': 0.10,
@@ -296,10 +516,10 @@ class HealthConfig:
             'stress_threshold': 0.30,
             'expected_range': (0.35, 0.55),
         },
-    }
+    })
     
     # Wheat NDVI thresholds by growth stage
-    WHEAT_NDVI = {
+    WHEAT_NDVI = _frozen_thresholds({
         'Sowing / Germination': {
             'healthy_min': 0.15,
             'stress_threshold': 0.10,
@@ -330,79 +550,176 @@ class HealthConfig:
             'stress_threshold': 0.30,
             'expected_range': (0.35, 0.55),
         },
-    }
+    })
     
     # General NDVI interpretation
-    NDVI_GENERAL = {
+    NDVI_GENERAL = MappingProxyType({
         'bare_soil': (-0.1, 0.1),
         'sparse_vegetation': (0.1, 0.2),
         'moderate_vegetation': (0.2, 0.4),
         'dense_vegetation': (0.4, 0.6),
         'very_healthy': (0.6, 1.0),
-    }
+    })
+    
+    # Per-pixel status codes produced by classify_pixels
+    PIXEL_NO_DATA = 0
+    PIXEL_HEALTHY = 1
+    PIXEL_STRESSED = 2
+    PIXEL_SEVERE = 3
+    
+    # NDVI_GENERAL as parallel sorted cut-offs (each band's lower bound)
+    # and labels for classify_ndvi
+    _NDVI_GENERAL_LABELS = tuple(NDVI_GENERAL)
+    _NDVI_GENERAL_CUTS = tuple(low for low, _ in NDVI_GENERAL.values())[1:]
     
     # Health status labels
-    HEALTH_STATUS = {
+    HEALTH_STATUS = MappingProxyType({
         'healthy': '✅ Healthy',
         'moderate_stress': '⚠️ Moderate Stress',
         'severe_stress': '🔴 Severe Stress',
         'critical': '❌ Critical',
-    }
+    })
+    
+    # Fallbacks for unknown stages and for crops without their own table
+    _RICE_DEFAULT = RICE_NDVI['Tillering']
+    _WHEAT_DEFAULT = WHEAT_NDVI['Tillering']
+    _OTHER_DEFAULT = MappingProxyType({
+        'healthy_min': 0.35,
+        'stress_threshold': 0.25,
+        'expected_range': (0.25, 0.55),
+    })
     
     @classmethod
-    def get_ndvi_thresholds(cls, crop: str, growth_stage: str) -> dict:
-        """Get NDVI thresholds for a specific crop and growth stage."""
+    def get_ndvi_thresholds(cls, crop: str, growth_stage: str) -> Mapping:
+        """
+        Get NDVI thresholds for a specific crop and growth stage.
+        The returned mapping is shared and read-only.
+        """
         if crop == 'Rice':
-            return cls.RICE_NDVI.get(growth_stage, cls.RICE_NDVI['Tillering'])
+            return cls.RICE_NDVI.get(growth_stage, cls._RICE_DEFAULT)
         elif crop == 'Wheat':
-            return cls.WHEAT_NDVI.get(growth_stage, cls.WHEAT_NDVI['Tillering'])
+            return cls.WHEAT_NDVI.get(growth_stage, cls._WHEAT_DEFAULT)
         else:
             # Default thresholds for 'Other' crops
-            return {
-                'healthy_min': 0.35,
-                'stress_threshold': 0.25,
-                'expected_range': (0.25, 0.55),
-            }
+            return cls._OTHER_DEFAULT
+    
+    @classmethod
+    def classify_ndvi(cls, ndvi: float) -> str:
+        """
+        NDVI_GENERAL label for a value; values outside -0.1..1.0 fall into
+        the first or last band.
+        """
+        return cls._NDVI_GENERAL_LABELS[bisect_right(cls._NDVI_GENERAL_CUTS, ndvi)]
+    
+    @classmethod
+    def get_ndvi_thresholds_by_month(cls, crop: str, month: int) -> Mapping:
+        """
+        NDVI thresholds for a crop in a calendar month, skipping the
+        growth-stage lookup. Same result as
+        get_ndvi_thresholds(crop, TemporalConfig.get_growth_stage(crop, month)).
+        """
+        thresholds = cls._NDVI_BY_CROP_MONTH.get((crop, month))
+        if thresholds is None:
+            return cls.get_ndvi_thresholds(crop, None)
+        return thresholds
+    
+    @classmethod
+    def classify_pixels(cls, ndvi, crop: str, month: int):
+        """
+        Classify every pixel of an NDVI array against the crop's thresholds.
+        
+        Args:
+            ndvi: Array-like of NDVI values (any shape)
+            crop: Crop type
+            month: Calendar month (1-12)
+            
+        Returns:
+            uint8 array of the same shape holding PIXEL_HEALTHY (>= healthy_min),
+            PIXEL_STRESSED (>= stress_threshold), PIXEL_SEVERE (below it) or
+            PIXEL_NO_DATA for NaN pixels
+        """
+        import numpy as np
+        
+        thresholds = cls.get_ndvi_thresholds_by_month(crop, month)
+        healthy_min = thresholds['healthy_min']
+        stress_threshold = thresholds['stress_threshold']
+        
+        ndvi = np.asarray(ndvi, dtype=np.float64)
+        healthy = ndvi >= healthy_min
+        stressed = ndvi >= stress_threshold
+        
+        out = np.full(ndvi.shape, cls.PIXEL_NO_DATA, dtype=np.uint8)
+        out[healthy] = cls.PIXEL_HEALTHY
+        out[stressed & ~healthy] = cls.PIXEL_STRESSED
+        out[ndvi < stress_threshold] = cls.PIXEL_SEVERE
+        return out
+
+
+# (crop, month) -> thresholds, pre-joined through the growth-stage tables
+HealthConfig._NDVI_BY_CROP_MONTH = MappingProxyType({
+    (crop, month): HealthConfig.get_ndvi_thresholds(crop, TemporalConfig.get_growth_stage(crop, month))
+    for crop in ('Rice', 'Wheat')
+    for month in range(1, 13)
+})
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # ADVISORY SYSTEM CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _rice_advisory() -> Dict:
+    import advisory_data
+    return advisory_data.RICE_ADVISORY
+
+
+def _wheat_advisory() -> Dict:
+    import advisory_data
+    return advisory_data.WHEAT_ADVISORY
+
+
+def _flat_advisory() -> Mapping:
+    """Read-only stress advice keyed by (crop, stress_type, growth_stage)."""
+    flat = {}
+    for crop, advisory in (('Rice', AdvisoryConfig.RICE_ADVISORY),
+                           ('Wheat', AdvisoryConfig.WHEAT_ADVISORY)):
+        for stress_type, stages in advisory.items():
+            for growth_stage, texts in stages.items():
+                flat[(crop, stress_type, sys.intern(growth_stage))] = tuple(texts)
+    return MappingProxyType(flat)
+
+
+def _general_advisory() -> Dict:
+    import advisory_data
+    return advisory_data.GENERAL_ADVISORY
+
+
 class AdvisoryConfig:
+    __slots__ = ()
     
     
     # Stress types
-    STRESS_TYPES = [
+    STRESS_TYPES = (
         'water_stress',
         'nutrient_deficiency',
         'general',
-    ]
-    
-    # Rice recommendations (same as before - truncated for brevity)
-    RICE_ADVISORY = {
-        'water_stress': {
-            'Transplanting': [
-                "Maintain 2-5 cm standing water in the field",
-                "Ensure proper bund maintenance to prevent water loss",
-            ],
-        },
-    }
+    )
     
-    # Wheat recommendations (same as before)
-    WHEAT_ADVISORY = {
-        'water_stress': {
-            'Sowing / Germination': [
-                "Apply pre-sowing irrigation (rauni) for proper germination",
-            ],
-        },
-    }
+    # The recommendation tables live in advisory_data and are only needed
+    # by the advisory system, so that module is loaded on first access
+    # rather than at import. The nested crop tables remain for existing
+    # readers; lookups should go through get_advice, which is served from
+    # the flat table below.
+    RICE_ADVISORY = _LazyTable(_rice_advisory)
+    WHEAT_ADVISORY = _LazyTable(_wheat_advisory)
+    GENERAL_ADVISORY = _LazyTable(_general_advisory)
     
-    GENERAL_ADVISORY = {
-        'healthy': [
-            "Crop appears healthy - continue regular monitoring",
-        ],
-    }
+    # Single-level view of the crop tables for get_advice
+    _ADVISORY_FLAT = _LazyTable(_flat_advisory)
+    
+    @classmethod
+    def get_advice(cls, crop: str, stress_type: str, growth_stage: str) -> Tuple[str, ...]:
+        """Stress-specific advice for a crop and growth stage, or an empty tuple."""
+        return cls._ADVISORY_FLAT.get((crop, stress_type, growth_stage), ())
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -411,6 +728,7 @@ class AdvisoryConfig:
 
 class UIConfig:
     """User interface settings."""
+    __slots__ = ()
     
     #APP_TITLE = "🌾 AI-Driven Agricultural Field Monitoring"
     #APP_SUBTITLE = "AI-Powered Agricultural Monitoring for Pakistan"
@@ -419,20 +737,20 @@ class UIConfig:
     DEFAULT_CENTER = [31.5, 73.0]  # Punjab center
     DEFAULT_ZOOM = 8
     
-    COLORS = {
+    COLORS = MappingProxyType({
         'rice': '#27ae60',
         'wheat': '#f39c12',
         'other': '#3498db',
         'healthy': '#2ecc71',
         'moderate': '#f1c40f',
         'severe': '#e74c3c',
-    }
+    })
     
-    CONFIDENCE_BADGES = {
+    CONFIDENCE_BADGES = MappingProxyType({
         'high': ('🟢', 'High Confidence'),
         'medium': ('🟡', 'Medium Confidence'),
         'low': ('🔴', 'Low Confidence'),
-    }
+    })
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -441,6 +759,7 @@ class UIConfig:
 
 class LogConfig:
     """Logging settings."""
+    __slots__ = ()
     
     LOG_LEVEL = 'INFO'
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -452,6 +771,12 @@ class LogConfig:
 # ─────────────────────────────────────────────────────────────────────────────
 
 __all__ = [
+    'IMAGE_SIZE',
+    'NUM_BANDS',
+    'NUM_MONTHS',
+    'NUM_CHANNELS',
+    'SCALE',
+    'BUFFER_SIZE',
     'PathConfig',
     'ModelConfig', 
     'DateConfig',
@@ -461,4 +786,4 @@ __all__ = [
     'AdvisoryConfig',
     'UIConfig',
     'LogConfig',
-]
\ No newline at end of file
+]
@@ -8,9 +8,13 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image as PILImage
 
-from config import GEEConfig, TemporalConfig, ModelConfig, DateConfig
+from config import (
+    GEEConfig, TemporalConfig, DateConfig,
+    IMAGE_SIZE, NUM_BANDS, NUM_CHANNELS, NUM_MONTHS, SCALE,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -77,6 +81,23 @@ class GEEFetcher:
         
         return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
     
+    def _monthly_collection(self,
+                            geometry: ee.Geometry,
+                            year: int,
+                            month: int) -> ee.ImageCollection:
+        """Sentinel-2 scenes over the geometry for one month."""
+        start_date, end_date = self._get_date_range_for_month(year, month)
+        
+        # More lenient cloud filter
+        return (ee.ImageCollection(GEEConfig.SENTINEL2_COLLECTION)
+                .filterBounds(geometry)
+                .filterDate(start_date, end_date)
+                .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 90)))
+    
+    def _composite(self, collection: ee.ImageCollection) -> ee.Image:
+        """Cloud-masked median of a collection, restricted to the model bands."""
+        return collection.map(self._mask_clouds).median().select(list(GEEConfig.BANDS))
+    
     def _create_monthly_composite(self, 
                                    geometry: ee.Geometry,
                                    year: int, 
@@ -84,13 +105,7 @@ class GEEFetcher:
         """
         Create monthly composite with proper filtering.
         """
-        start_date, end_date = self._get_date_range_for_month(year, month)
-        
-        # More lenient cloud filter
-        collection = (ee.ImageCollection(GEEConfig.SENTINEL2_COLLECTION)
-                     .filterBounds(geometry)
-                     .filterDate(start_date, end_date)
-                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 90)))
+        collection = self._monthly_collection(geometry, year, month)
         
         count = collection.size().getInfo()
         
@@ -100,14 +115,52 @@ class GEEFetcher:
         
         logger.info(f"   Found {count} images for {year}-{month:02d}")
         
-        # Apply cloud masking
-        masked_collection = collection.map(self._mask_clouds)
-        composite = masked_collection.median()
+        return self._composite(collection), count
+    
+    def _sample_months_batched(self,
+                               region: ee.Geometry,
+                               months_to_fetch: List[Tuple[int, int, int]]
+                               ) -> Dict[Tuple[int, int], Tuple[int, Optional[np.ndarray]]]:
+        """
+        Composite and sample every requested month in a single getInfo call.
         
-        # Select required bands
-        composite = composite.select(GEEConfig.BANDS)
+        Returns {(year, month): (image_count, bands)} where bands is a
+        (NUM_BANDS, H, W) float32 array, or None when the month has no
+        images or the sampled grid is all zeros.
+        """
+        if not months_to_fetch:
+            return {}
+        
+        rect = region.bounds()
+        
+        per_month = []
+        for year, month, _ in months_to_fetch:
+            collection = self._monthly_collection(region, year, month)
+            count = collection.size()
+            
+            # Median composites lose the native projection, so pin the
+            # sampling grid to the Sentinel-2 resolution
+            sample = (self._composite(collection)
+                      .reproject(crs='EPSG:4326', scale=SCALE)
+                      .sampleRectangle(region=rect, defaultValue=0))
+            bands = ee.List([sample.get(band) for band in GEEConfig.BANDS])
+            
+            # Empty months have no bands to sample; only send back the count
+            per_month.append(ee.List([
+                count,
+                ee.Algorithms.If(count.gt(0), bands, ee.List([])),
+            ]))
         
-        return composite, count
+        payload = ee.List(per_month).getInfo()
+        
+        batched = {}
+        for (year, month, _), (count, bands) in zip(months_to_fetch, payload):
+            month_data = np.asarray(bands, dtype=np.float32) if bands else None
+            if month_data is not None and not np.any(month_data):
+                month_data = None
+            batched[(year, month)] = (count, month_data)
+        
+        return batched
     
     def _image_to_array_proper(self, 
                                 image: ee.Image, 
@@ -127,14 +180,14 @@ class GEEFetcher:
                     numPixels=64 * 64  # Target number of pixels
                 )
                 
-                sample_size = sampled.size().getInfo()
+                # Convert to list of features; the list length is the
+                # sample size, so no separate size() round trip
+                features = sampled.toList(64 * 64).getInfo()
+                sample_size = len(features)
                 
                 if sample_size > 0:
                     logger.info(f"      Method 1 (sample): Got {sample_size} pixels")
                     
-                    # Convert to list of features
-                    features = sampled.toList(sample_size).getInfo()
-                    
                     if features and len(features) > 0:
                         # Extract band values from features
                         band_data = {band: [] for band in GEEConfig.BANDS}
@@ -196,12 +249,10 @@ class GEEFetcher:
                     properties=[],
                 )
                 
-                band_arrays = []
-                for band in GEEConfig.BANDS:
-                    band_data = np.array(result.get(band).getInfo())
-                    band_arrays.append(band_data)
+                # All bands in one round trip
+                band_arrays = ee.List([result.get(band) for band in GEEConfig.BANDS]).getInfo()
                 
-                result_array = np.stack(band_arrays, axis=0).astype(np.float32)
+                result_array = np.asarray(band_arrays, dtype=np.float32)
                 
                 if np.max(result_array) > 0:
                     logger.info(f"      ✓ Method 2 SUCCESS: {result_array.shape}, max={np.max(result_array):.0f}")
@@ -223,7 +274,7 @@ class GEEFetcher:
                     'region': region,
                     'dimensions': '64x64',
                     'format': 'png',
-                    'bands': GEEConfig.BANDS,
+                    'bands': list(GEEConfig.BANDS),
                     'min': 0,
                     'max': 3000,  # Typical reflectance range
                 }
@@ -259,37 +310,31 @@ class GEEFetcher:
             # ═══════════════════════════════════════════════════════════════
             logger.error(f"      ❌ ALL METHODS FAILED - returning zeros")
             return np.zeros((len(GEEConfig.BANDS), 
-                           ModelConfig.IMAGE_SIZE[0], 
-                           ModelConfig.IMAGE_SIZE[1]), 
+                           IMAGE_SIZE[0], 
+                           IMAGE_SIZE[1]), 
                           dtype=np.float32)
             
         except Exception as e:
             logger.error(f"      Fatal error in image_to_array: {str(e)}")
             return np.zeros((len(GEEConfig.BANDS), 
-                           ModelConfig.IMAGE_SIZE[0], 
-                           ModelConfig.IMAGE_SIZE[1]), 
+                           IMAGE_SIZE[0], 
+                           IMAGE_SIZE[1]), 
                           dtype=np.float32)
     
-    def _get_season_month_mapping(self, season: str) -> Dict[int, int]:
-        """Get month to slot mapping."""
-        if season == 'Rice':
-            return {5: 0, 6: 1, 7: 2, 8: 3, 9: 4, 10: 5}
-        else:
-            return {11: 0, 12: 1, 1: 2, 2: 3, 3: 4, 4: 5}
-    
     def _get_months_to_fetch(self, query_date: datetime, season: str) -> List[Tuple[int, int, int]]:
         """Determine which months to fetch."""
         month = query_date.month
         year = query_date.year
         
-        month_to_slot = self._get_season_month_mapping(season)
+        # Any season other than Rice uses the wheat slot layout
+        slot_season = 'Rice' if season == 'Rice' else 'Wheat'
         months_to_fetch = []
         
         if season == 'Rice':
             season_months = [5, 6, 7, 8, 9, 10]
             for m in season_months:
                 if m <= month:
-                    slot = month_to_slot[m]
+                    slot = TemporalConfig.get_month_idx(slot_season, m)
                     months_to_fetch.append((year, m, slot))
         else:
             if month >= 11:
@@ -304,11 +349,83 @@ class GEEFetcher:
             for m_year, m in season_months:
                 m_date = datetime(m_year, m, 15)
                 if m_date <= query_date:
-                    slot = month_to_slot[m]
+                    slot = TemporalConfig.get_month_idx(slot_season, m)
                     months_to_fetch.append((m_year, m, slot))
         
         return months_to_fetch
     
+    def _fetch_one_month(self,
+                         region: ee.Geometry,
+                         year: int,
+                         month: int,
+                         slot_idx: int,
+                         sampled: Tuple[Optional[int], Optional[np.ndarray]]
+                         ) -> Tuple[int, Optional[np.ndarray], str]:
+        """
+        Extract, resize and scale one month of imagery.
+        
+        sampled is this month's entry from _sample_months_batched, or
+        (None, None) to fetch the month on its own. Returns
+        (slot_idx, month_data or None, "YYYY-MM").
+        """
+        label = f"{year}-{month:02d}"
+        logger.info(f"Fetching: {label} (Slot {slot_idx})")
+        
+        try:
+            img_count, month_data = sampled
+            
+            if img_count == 0:
+                logger.warning(f"   ✗ {label}: No images available")
+                return slot_idx, None, label
+            
+            if month_data is not None:
+                logger.info(f"   {label}: Found {img_count} images, sampled in batch")
+            else:
+                composite, img_count = self._create_monthly_composite(region, year, month)
+                
+                if composite is None or img_count == 0:
+                    logger.warning(f"   ✗ {label}: No images available")
+                    return slot_idx, None, label
+                
+                # Convert to array using proper method
+                month_data = self._image_to_array_proper(composite, region)
+            
+            # Validate
+            data_max = np.max(month_data)
+            data_sum = np.sum(month_data)
+            
+            if data_max == 0 or data_sum == 0:
+                logger.warning(f"   ✗ {label}: Extracted data is all zeros")
+                return slot_idx, None, label
+            
+            logger.info(f"   {label} raw: min={np.min(month_data):.0f}, max={data_max:.0f}, mean={np.mean(month_data):.0f}")
+            
+            # Resize if needed
+            if month_data.shape[1:] != IMAGE_SIZE:
+                resized_bands = []
+                for b in range(month_data.shape[0]):
+                    band_img = PILImage.fromarray(month_data[b])
+                    band_img = band_img.resize(IMAGE_SIZE, PILImage.BILINEAR)
+                    resized_bands.append(np.array(band_img))
+                month_data = np.stack(resized_bands, axis=0)
+            
+            # Normalize
+            month_data = month_data / 10000.0
+            month_data = np.clip(month_data, 0, 1)
+            
+            # Final check
+            if np.max(month_data) < 0.001:
+                logger.warning(f"   ✗ {label}: Data near-zero after scaling")
+                return slot_idx, None, label
+            
+            logger.info(f"   {label} scaled: min={np.min(month_data):.4f}, max={np.max(month_data):.4f}")
+            
+            return slot_idx, month_data, label
+            
+        except Exception as e:
+            logger.error(f"   ✗ {label}: Error: {str(e)}")
+            return slot_idx, None, label
+    
     def fetch_temporal_stack(self,
                              latitude: float,
                              longitude: float,
@@ -341,76 +458,48 @@ class GEEFetcher:
         
         # Initialize stack
         image_stack = np.zeros(
-            (ModelConfig.NUM_CHANNELS, ModelConfig.IMAGE_SIZE[0], ModelConfig.IMAGE_SIZE[1]),
+            (NUM_CHANNELS, IMAGE_SIZE[0], IMAGE_SIZE[1]),
             dtype=np.float32
         )
-        availability_mask = [0] * ModelConfig.NUM_MONTHS
+        availability_mask = [0] * NUM_MONTHS
         
         current_ndvi = None
         latest_month_data = None
         successful_months = []
         
-        # Fetch each month
-        for year, month, slot_idx in months_to_fetch:
-            logger.info(f"{'─'*60}")
-            logger.info(f"Fetching: {year}-{month:02d} (Slot {slot_idx})")
-            logger.info(f"{'─'*60}")
-            
-            try:
-                composite, img_count = self._create_monthly_composite(region, year, month)
-                
-                if composite is None or img_count == 0:
-                    logger.warning(f"   ✗ No images available\n")
-                    continue
-                
-                # Convert to array using proper method
-                month_data = self._image_to_array_proper(composite, region)
-                
-                # Validate
-                data_max = np.max(month_data)
-                data_sum = np.sum(month_data)
-                
-                if data_max == 0 or data_sum == 0:
-                    logger.warning(f"   ✗ Extracted data is all zeros\n")
-                    continue
-                
-                logger.info(f"   Raw: min={np.min(month_data):.0f}, max={data_max:.0f}, mean={np.mean(month_data):.0f}")
-                
-                # Resize if needed
-                if month_data.shape[1:] != ModelConfig.IMAGE_SIZE:
-                    resized_bands = []
-                    for b in range(month_data.shape[0]):
-                        band_img = PILImage.fromarray(month_data[b])
-                        band_img = band_img.resize(ModelConfig.IMAGE_SIZE, PILImage.BILINEAR)
-                        resized_bands.append(np.array(band_img))
-                    month_data = np.stack(resized_bands, axis=0)
-                
-                # Normalize
-                month_data = month_data / 10000.0
-                month_data = np.clip(month_data, 0, 1)
-                
-                # Final check
-                if np.max(month_data) < 0.001:
-                    logger.warning(f"   ✗ Data near-zero after scaling\n")
-                    continue
-                
-                logger.info(f"   Scaled: min={np.min(month_data):.4f}, max={np.max(month_data):.4f}")
-                
-                # Place in stack
-                start_channel = slot_idx * ModelConfig.NUM_BANDS
-                end_channel = start_channel + ModelConfig.NUM_BANDS
-                
-                image_stack[start_channel:end_channel] = month_data
-                availability_mask[slot_idx] = 1
-                
-                latest_month_data = month_data
-                successful_months.append(f"{year}-{month:02d}")
-                
-                logger.info(f"   ✓✓✓ SUCCESS: Slot {slot_idx} filled (channels {start_channel}-{end_channel-1})\n")
-                
-            except Exception as e:
-                logger.error(f"   ✗ Error: {str(e)}\n")
+        # Sample all months in one request; months it cannot serve fall
+        # back to the per-month extraction below
+        try:
+            batched = self._sample_months_batched(region, months_to_fetch)
+        except Exception as e:
+            logger.warning(f"Batched fetch failed, fetching months one by one: {str(e)}")
+            batched = {}
+        
+        # Months are independent and slots are disjoint, so fetch them
+        # concurrently and fill the stack back on this thread in month order
+        with ThreadPoolExecutor(max_workers=GEEConfig.MAX_FETCH_WORKERS) as executor:
+            futures = [
+                executor.submit(self._fetch_one_month, region, year, month, slot_idx,
+                                batched.get((year, month), (None, None)))
+                for year, month, slot_idx in months_to_fetch
+            ]
+            fetched = [future.result() for future in futures]
+        
+        for slot_idx, month_data, label in fetched:
+            if month_data is None:
                 continue
+            
+            # Place in stack
+            start_channel = slot_idx * NUM_BANDS
+            end_channel = start_channel + NUM_BANDS
+            
+            image_stack[start_channel:end_channel] = month_data
+            availability_mask[slot_idx] = 1
+            
+            latest_month_data = month_data
+            successful_months.append(label)
+            
+            logger.info(f"   ✓✓✓ SUCCESS: {label} -> Slot {slot_idx} (channels {start_channel}-{end_channel-1})")
         
         # Calculate NDVI
         if latest_month_data is not None:
@@ -6,6 +6,7 @@ import numpy as np
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 import logging
+import time
 
 from config import TemporalConfig, HealthConfig
 
@@ -116,7 +117,7 @@ class HealthAssessor:
     
     def __init__(self, crop: str):
         self.crop = crop
-        self.current_month = datetime.now().month
+        self.current_month = time.localtime().tm_mon
         self.stage = self._get_stage()
         self.thresholds = self._get_thresholds()
     
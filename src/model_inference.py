@@ -284,22 +284,7 @@ class CropClassifier:
     
     def _get_confidence_level(self, confidence: float, months_available: int) -> str:
         """Determine confidence level."""
-        if months_available >= 5:
-            high_thresh = ModelConfig.HIGH_CONFIDENCE_THRESHOLD
-            med_thresh = ModelConfig.MEDIUM_CONFIDENCE_THRESHOLD
-        elif months_available >= 3:
-            high_thresh = 0.90
-            med_thresh = 0.75
-        else:
-            high_thresh = 0.95
-            med_thresh = 0.80
-        
-        if confidence >= high_thresh:
-            return 'high'
-        elif confidence >= med_thresh:
-            return 'medium'
-        else:
-            return 'low'
+        return ModelConfig.classify_confidence(confidence, months_available)
     
     
     def predict(self, 
@@ -390,10 +375,7 @@ class CropClassifier:
         raw_prediction = ModelConfig.IDX_TO_CLASS[predicted_idx]
         
         probs_np = avg_probs.cpu().numpy()[0]
-        probabilities = {
-            ModelConfig.IDX_TO_CLASS[i]: float(probs_np[i]) 
-            for i in range(ModelConfig.NUM_CLASSES)
-        }
+        probabilities = dict(zip(ModelConfig.IDX_TO_CLASS, probs_np.tolist()))
         
         # ═══════════════════════════════════════════════════════════════════
         # Season validation
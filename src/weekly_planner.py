@@ -5,6 +5,7 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
+import time
 import numpy as np
 
 from config import TemporalConfig
@@ -91,7 +92,7 @@ class WeeklyPlanner:
         self.lat = lat
         self.lon = lon
         self.config = CROP_CONFIG.get(crop, CROP_CONFIG['Wheat'])
-        self.current_month = datetime.now().month
+        self.current_month = time.localtime().tm_mon
         self.current_stage = self.config['stages'].get(self.current_month, 'Unknown')
         self.health_assessor = HealthAssessor(crop)
     
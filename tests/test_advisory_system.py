@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from advisory_system import AdvisorySystem
+
+np = pytest.importorskip("numpy")
+
+
+def _scalar(advisor, crop, stage, ndvi, deviation, status, severity):
+    return advisor.generate_advisory(crop, stage, {
+        'status': status,
+        'severity': severity,
+        'current_ndvi': ndvi,
+        'deviation_percent': deviation,
+    })
+
+
+def _without_timestamp(advisory):
+    return {k: v for k, v in advisory.items() if k != 'generated_at'}
+
+
+def test_batch_matches_scalar_for_missing_labels():
+    advisor = AdvisorySystem()
+    rows = [
+        (None, 'Tillering', 0.41, -15.0, 'moderate_stress', 1),
+        ('Rice', None, 0.62, 3.0, 'healthy', 0),
+        ('Wheat', 'Heading', 0.30, -25.0, None, 2),
+        ('', '', 0.50, 0.0, 'healthy', 0),
+    ]
+
+    batch = advisor.generate_advisory_batch(*zip(*rows))
+
+    assert len(batch) == len(rows)
+    for row, advisory in zip(rows, batch):
+        assert _without_timestamp(advisory) == _without_timestamp(_scalar(advisor, *row))
+    assert batch[0]['crop'] is None
+    assert 'unknown' in batch[0]['summary']
+
+
+def test_batch_duplicate_rows_get_separate_dicts():
+    advisor = AdvisorySystem()
+    row = ('Rice', 'Tillering', 0.41, -15.0, 'moderate_stress', 1)
+
+    batch = advisor.generate_advisory_batch(*zip(row, row))
+
+    assert _without_timestamp(batch[0]) == _without_timestamp(batch[1])
+    assert _without_timestamp(batch[0]) == _without_timestamp(_scalar(advisor, *row))
+
+    batch[0]['recommendations'].clear()
+    batch[0]['action_plan']['immediate'].append('edited')
+
+    assert batch[1]['recommendations']
+    assert 'edited' not in batch[1]['action_plan']['immediate']